@@ -1,11 +1,52 @@
 """# Bitpin Python Library."""
 
-import deprecated
+import importlib
+import typing as _t
 
-from .clients.async_client import AsyncClient
-from .clients.client import Client
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from .clients.async_client import AsyncClient
+    from .clients.client import Client
 
-__all__ = ["AsyncClient", "Client", "deprecated"]
+__all__ = ["AsyncClient", "Client"]
+
+_LAZY_IMPORTS = {
+    "AsyncClient": ".clients.async_client",
+    "Client": ".clients.client",
+}
+
+
+def __getattr__(name: str) -> _t.Any:
+    """
+    Import public attributes lazily on first access (PEP 562).
+
+    Args:
+        name (str): Attribute name.
+
+    Returns:
+        Any: Attribute.
+
+    Raises:
+        AttributeError: If attribute is not found.
+    """
+
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    List module attributes including lazily imported ones.
+
+    Returns:
+        list[str]: Attribute names.
+    """
+
+    return sorted({*globals(), *__all__})
 
 
 # Meta
@@ -1,6 +1,17 @@
 """# Utility functions for bitpin module."""
 
 import asyncio
+import functools
+import inspect
+import json
+import time
+import typing as t
+from warnings import warn
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 
 def get_loop() -> asyncio.AbstractEventLoop:
@@ -9,15 +20,137 @@ def get_loop() -> asyncio.AbstractEventLoop:
 
     Returns:
         asyncio.AbstractEventLoop
+
+    Notes:
+        Returns the running event loop if there is one, else creates a new event loop
+        and sets it as the current event loop.
     """
 
     try:
-        loop = asyncio.get_event_loop()
-        return loop
-    except RuntimeError as e:
-        if str(e).startswith("There is no current event loop in thread"):
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            return loop
-
-        raise e
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    return loop
+
+
+def install_uvloop() -> bool:
+    """
+    Install uvloop event loop policy.
+
+    Returns:
+        bool: True if uvloop policy is installed, else False.
+
+    Notes:
+        Falls back to the default event loop policy with a warning if uvloop is not installed.
+    """
+
+    try:
+        import uvloop  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        warn(
+            "uvloop is not installed! falling back to default event loop. install it with `python-bitpin[uvloop]`.",
+            RuntimeWarning,
+            2,
+        )
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def json_loads(data: t.Union[str, bytes]) -> t.Any:
+    """
+    Deserialize JSON.
+
+    Args:
+        data (t.Union[str, bytes]): JSON document.
+
+    Returns:
+        t.Any: Deserialized object.
+
+    Notes:
+        Uses orjson if installed, else falls back to the standard library.
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: t.Any) -> bytes:
+    """
+    Serialize JSON to UTF-8 encoded bytes.
+
+    Args:
+        obj (t.Any): Object.
+
+    Returns:
+        bytes: JSON document.
+
+    Notes:
+        Uses orjson if installed, else falls back to the standard library.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(obj)  # type: ignore[no-any-return]
+    return json.dumps(obj).encode()
+
+
+def ttl_cached(seconds: float) -> t.Callable[[t.Callable[..., t.Any]], t.Callable[..., t.Any]]:
+    """
+    Cache a client method's response for `seconds`.
+
+    Args:
+        seconds (float): Time to live of cached response.
+
+    Returns:
+        Callable: Decorator.
+
+    Notes:
+        Responses are stored in the client's `_ttl_cache` dict and only calls without arguments are cached.
+        Cached responses are shared between callers, so they should not be mutated.
+
+        Coroutine functions are supported, their awaited result is cached.
+    """
+
+    def decorator(func: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
+        key = func.__name__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self: t.Any, *args: t.Any, **kwargs: t.Any) -> t.Any:
+                if args or kwargs:
+                    return await func(self, *args, **kwargs)
+
+                now = time.monotonic()
+                cached = self._ttl_cache.get(key)
+                if cached is not None and cached[0] > now:
+                    return cached[1]
+
+                result = await func(self)
+                self._ttl_cache[key] = (now + seconds, result)
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self: t.Any, *args: t.Any, **kwargs: t.Any) -> t.Any:
+            if args or kwargs:
+                return func(self, *args, **kwargs)
+
+            now = time.monotonic()
+            cached = self._ttl_cache.get(key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
+            result = func(self)
+            self._ttl_cache[key] = (now + seconds, result)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -10,10 +10,53 @@ See [API Reference](https://docs.bitpin.ir/) for more information.
 [Core](core) Submodule contains the core client.
 """
 
-from .async_client import AsyncClient
-from .client import Client
+import importlib
+import typing as _t
+
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from .async_client import AsyncClient
+    from .client import Client
 
 __all__ = [
     "AsyncClient",
     "Client",
 ]
+
+_LAZY_IMPORTS = {
+    "AsyncClient": ".async_client",
+    "Client": ".client",
+}
+
+
+def __getattr__(name: str) -> _t.Any:
+    """
+    Import clients lazily on first access (PEP 562).
+
+    Args:
+        name (str): Attribute name.
+
+    Returns:
+        Any: Attribute.
+
+    Raises:
+        AttributeError: If attribute is not found.
+    """
+
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    List module attributes including lazily imported ones.
+
+    Returns:
+        list[str]: Attribute names.
+    """
+
+    return sorted({*globals(), *__all__})
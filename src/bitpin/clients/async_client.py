@@ -3,13 +3,19 @@
 # pylint: disable=invalid-overridden-method
 
 import asyncio
+from contextlib import suppress
 from warnings import warn
 
 import aiohttp
 
 from .. import enums
 from .. import response_types as t
-from .._utils import get_loop
+from .._utils import (
+    get_loop,
+    install_uvloop,
+    json_loads,
+    ttl_cached,
+)
 from ..exceptions import (
     APIException,
     RequestException,
@@ -29,13 +35,18 @@ class AsyncClient(CoreClient):
         get_tickets_info: Get tickets info.
         get_wallets: Get wallets.
         get_orderbook: Get orderbook.
+        get_orderbooks: Get orderbooks of several symbols concurrently.
         get_recent_trades: Get recent trades.
         get_user_orders: Get user orders.
+        iter_user_orders: Iterate over user orders page by page.
         create_order: Create order.
         cancel_order: Cancel order.
         create_order_bulk: Create Bulk Order.
+        create_orders_parallel: Create orders across markets concurrently.
         cancel_order_bulk: Cancel Bulk Order.
         get_user_trades: Get user trades.
+        iter_user_trades: Iterate over user trades page by page.
+        warm_up: Open a pooled connection ahead of the first call.
         close_connection: Close connection.
 
     Attributes:
@@ -47,6 +58,22 @@ class AsyncClient(CoreClient):
         access_token (str): Access token.
     """
 
+    __slots__ = (
+        "loop",
+        "_session_params",
+        "_background_tasks",
+        "_relogin_handle",
+        "_refresh_handle",
+        "_login_task",
+        "_refresh_task",
+        "_ttl_cache",
+    )
+
+    CONNECTOR_LIMIT = 100
+    CONNECTOR_LIMIT_PER_HOST = 32
+    CONNECTOR_DNS_CACHE_TTL = 300
+    CONNECTOR_KEEPALIVE_TIMEOUT: float = 75
+
     def __init__(  # type: ignore[no-untyped-def]
         self,
         api_key: t.OptionalStr = None,
@@ -60,6 +87,7 @@ class AsyncClient(CoreClient):
         background_relogin_interval: int = 60 * 60 * 24 * 6,
         background_refresh_token: bool = False,
         background_refresh_token_interval: int = 60 * 13,
+        use_uvloop: bool = False,
     ):
         """
         Constructor.
@@ -76,6 +104,7 @@ class AsyncClient(CoreClient):
             background_relogin_interval (int): Background refresh interval.
             background_refresh_token (bool): Background refresh token.
             background_refresh_token_interval (int): Background refresh token interval.
+            use_uvloop (bool): Use uvloop event loop policy.
 
         Notes:
             If `api_key` and `api_secret` are not provided, they will be read from the environment variables
@@ -84,6 +113,8 @@ class AsyncClient(CoreClient):
             If `access_token` and `refresh_token` are not provided, they will be read from the environment variables
             `BITPIN_ACCESS_TOKEN` and `BITPIN_REFRESH_TOKEN` respectively.
 
+            Environment variables are read once per process, call `bitpin.envs.refresh()` after changing them.
+
             If `requests_params` are provided, they will be used as default for every request.
 
             If `requests_params` are provided in `kwargs`, they will override existing `requests_params`.
@@ -93,10 +124,36 @@ class AsyncClient(CoreClient):
 
             If `background_refresh_token` is enabled, refresh token will be refreshed in background every
             `background_refresh_token_interval` seconds.
+
+            If `use_uvloop` is enabled and `loop` is not provided, uvloop event loop policy will be installed
+            before getting the event loop. It only works when the client is constructed synchronously before any
+            event loop exists, inside a running loop it has no effect and a warning is issued.
+
+            On Python 3.12+, the client's own tasks (token requests and background tasks) start eagerly, running
+            synchronously until their first suspension point. The event loop's task factory is left untouched.
         """
 
+        if use_uvloop and loop is None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                install_uvloop()
+            else:
+                warn(
+                    "use_uvloop has no effect inside a running event loop! install uvloop before starting the loop.",
+                    RuntimeWarning,
+                    2,
+                )
+
         self.loop = loop or get_loop()
         self._session_params = session_params or {}
+        self.session: t.t.Optional[aiohttp.ClientSession] = None
+        self._background_tasks: set[asyncio.Task] = set()
+        self._relogin_handle: t.t.Optional[asyncio.TimerHandle] = None
+        self._refresh_handle: t.t.Optional[asyncio.TimerHandle] = None
+        self._login_task: t.t.Optional[asyncio.Task] = None
+        self._refresh_task: t.t.Optional[asyncio.Task] = None
+        self._ttl_cache: dict[str, tuple[float, t.t.Any]] = {}
 
         super().__init__(
             api_key,
@@ -143,6 +200,10 @@ class AsyncClient(CoreClient):
 
         Returns:
             AsyncClient: AsyncClient.
+
+        Notes:
+            The event loop is already running here, so `use_uvloop` is not accepted. Construct the client with
+            `use_uvloop=True` before starting the event loop instead.
         """
 
         self = cls(
@@ -162,6 +223,38 @@ class AsyncClient(CoreClient):
         await self._handle_login()
         return self
 
+    async def __aenter__(self) -> "AsyncClient":
+        """
+        Enter async context.
+
+        Returns:
+            AsyncClient: AsyncClient.
+        """
+
+        return self
+
+    async def __aexit__(self, *args: t.t.Any) -> None:
+        """Exit async context and close connection."""
+
+        await self.close_connection()
+
+    def _init_connector(self) -> aiohttp.TCPConnector:
+        """
+        Initialize connector.
+
+        Returns:
+            connector (aiohttp.TCPConnector): Keep-alive connection pool.
+        """
+
+        return aiohttp.TCPConnector(
+            loop=self.loop,
+            limit=self.CONNECTOR_LIMIT,
+            limit_per_host=self.CONNECTOR_LIMIT_PER_HOST,
+            ttl_dns_cache=self.CONNECTOR_DNS_CACHE_TTL,
+            keepalive_timeout=self.CONNECTOR_KEEPALIVE_TIMEOUT,
+            enable_cleanup_closed=True,
+        )
+
     def _init_session(self) -> aiohttp.ClientSession:
         """
         Initialize session.
@@ -169,15 +262,24 @@ class AsyncClient(CoreClient):
         Returns:
             session (aiohttp.ClientSession): Session.
 
+        Notes:
+            Session is created lazily on the first request and reused by every request afterward.
+
+            If `connector` is provided in `session_params`, it will be used instead of the default connector.
         """
 
+        session_params = self._session_params
+        if "connector" not in session_params:
+            session_params = {**session_params, "connector": self._init_connector()}
+
         session = aiohttp.ClientSession(
             loop=self.loop,
             headers={
                 "Content-Type": "application/json",
                 "Accept": "application/json",
+                "User-Agent": self.USER_AGENT,
             },
-            **self._session_params,
+            **session_params,
         )
         return session
 
@@ -290,8 +392,11 @@ class AsyncClient(CoreClient):
 
         kwargs = self._get_request_kwargs(method, signed, **kwargs)
 
-        async with getattr(self.session, method)(uri, **kwargs) as response:
-            self.response = response  # pylint: disable=attribute-defined-outside-init
+        if self.session is None or self.session.closed:
+            self.session = self._init_session()
+
+        async with self.session.request(method, uri, **kwargs) as response:
+            self.response = response
             return await self._handle_response(response)
 
     @staticmethod
@@ -308,49 +413,144 @@ class AsyncClient(CoreClient):
         Raises:
             APIException: API Exception.
             RequestException: Request Exception.
+
+        Notes:
+            A successful DELETE without a body (i.e. 204) returns a success result with the ID from the URL.
         """
 
-        if not str(response.status).startswith("2"):
-            raise APIException(response, response.status, await response.text())
+        if not 200 <= response.status < 300:
+            raise APIException(response, response.status, await response.read())
+        if response.method == "DELETE" and response.status == 204:
+            response.release()
+            return {"status": "success", "id": response.request_info.url.parts[-2]}
+        body = await response.read()
+        if response.method == "DELETE" and not body:
+            return {"status": "success", "id": response.request_info.url.parts[-2]}
         try:
-            if response.method.lower() == enums.RequestMethod.DELETE:
-                return {"status": "success", "id": response.request_info.url.parts[-2]}
-            return await response.json()  # type: ignore[no-any-return]
+            return json_loads(body)  # type: ignore[no-any-return]
         except ValueError as exc:
-            msg = f"Invalid Response: {await response.text()}"
+            msg = f"Invalid Response: {body.decode(errors='replace')}"
             raise RequestException(msg) from exc
 
-    async def _background_relogin_task(self) -> None:  # type: ignore[override]
-        """Background relogin task."""
+    @staticmethod
+    def _create_task(coro: t.t.Coroutine[t.t.Any, t.t.Any, t.t.Any]) -> asyncio.Task:
+        """
+        Create a task on the running event loop.
 
-        while True:
-            try:
-                await self.login()
-                await asyncio.sleep(self._background_relogin_interval)
-            except Exception:  # pylint: disable=broad-except
-                continue
+        Args:
+            coro (Coroutine): Coroutine.
 
-    async def _background_refresh_token_task(self) -> None:  # type: ignore[override]
-        """Background refresh token task."""
+        Returns:
+            asyncio.Task: Task.
 
-        while True:
-            try:
-                await self.refresh_access_token()
-                await asyncio.sleep(self._background_refresh_token_interval)
-            except Exception:  # pylint: disable=broad-except
-                continue
+        Notes:
+            On Python 3.12+ the task is created with `asyncio.eager_task_factory`, without installing it on the loop.
+        """
+
+        loop = asyncio.get_running_loop()
+        if hasattr(asyncio, "eager_task_factory"):
+            return asyncio.eager_task_factory(loop, coro)  # type: ignore[no-any-return]
+        return loop.create_task(coro)
+
+    def _start_background_task(
+        self, func: t.t.Callable[..., t.t.Coroutine[t.t.Any, t.t.Any, None]], *args: t.t.Any
+    ) -> None:
+        """
+        Start a background task and keep a reference to it until it is done.
+
+        Args:
+            func (Callable): Coroutine function.
+            *args: Args.
+        """
+
+        task = self._create_task(func(*args))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _schedule_relogin(self, delay: t.t.Optional[float] = None, attempt: int = 0) -> None:
+        """
+        (Re)schedule background relogin.
+
+        Args:
+            delay (float): Delay in seconds, defaults to `background_relogin_interval`.
+            attempt (int): Number of consecutive failures.
+        """
+
+        if self._relogin_handle is not None:
+            self._relogin_handle.cancel()
+
+        self._relogin_handle = asyncio.get_running_loop().call_later(
+            self._background_relogin_interval if delay is None else delay,
+            self._start_background_task,
+            self._background_relogin_task,
+            attempt,
+        )
+
+    def _schedule_refresh(self, delay: t.t.Optional[float] = None, attempt: int = 0) -> None:
+        """
+        (Re)schedule background refresh token.
+
+        Args:
+            delay (float): Delay in seconds, defaults to `background_refresh_token_interval`.
+            attempt (int): Number of consecutive failures.
+        """
+
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+
+        self._refresh_handle = asyncio.get_running_loop().call_later(
+            self._background_refresh_token_interval if delay is None else delay,
+            self._start_background_task,
+            self._background_refresh_token_task,
+            attempt,
+        )
+
+    async def _background_relogin_task(self, attempt: int = 0) -> None:  # type: ignore[override]
+        """
+        Background relogin task.
+
+        Args:
+            attempt (int): Number of consecutive failures.
+
+        Notes:
+            A successful login reschedules the next run, failures are retried with exponential backoff.
+        """
+
+        try:
+            await self.login()
+        except Exception:  # pylint: disable=broad-except
+            attempt += 1
+            self._schedule_relogin(min(self.BACKGROUND_RETRY_MAX_DELAY, 2**attempt), attempt)
+
+    async def _background_refresh_token_task(self, attempt: int = 0) -> None:  # type: ignore[override]
+        """
+        Background refresh token task.
+
+        Args:
+            attempt (int): Number of consecutive failures.
+
+        Notes:
+            A successful refresh reschedules the next run, failures are retried with exponential backoff.
+        """
+
+        try:
+            await self.refresh_access_token()
+        except Exception:  # pylint: disable=broad-except
+            attempt += 1
+            self._schedule_refresh(min(self.BACKGROUND_RETRY_MAX_DELAY, 2**attempt), attempt)
 
     async def _handle_login(self) -> None:  # type: ignore[override]
         """Handle login."""
 
         if self.api_key and self.api_secret:
             await self.login()
+            return
 
         if self._background_relogin:
-            self.loop.create_task(self._background_relogin_task())
+            self._schedule_relogin(0)
 
         if self._background_refresh_token:
-            self.loop.create_task(self._background_refresh_token_task())
+            self._schedule_refresh(0)
 
     async def login(self, **kwargs) -> t.LoginResponse:  # type: ignore[no-untyped-def, override]
         """
@@ -364,6 +564,25 @@ class AsyncClient(CoreClient):
 
         References:
             [API Docs](https://docs.bitpin.ir/v1/docs/authentication/intro)
+
+        Notes:
+            Concurrent calls share a single in-flight login request, so `kwargs` of later callers are
+            ignored while one is pending.
+        """
+
+        if self._login_task is None or self._login_task.done():
+            self._login_task = self._create_task(self._login(**kwargs))
+        return await asyncio.shield(self._login_task)
+
+    async def _login(self, **kwargs) -> t.LoginResponse:  # type: ignore[no-untyped-def]
+        """
+        Send login request and set (refresh_token/access_token).
+
+        Args:
+            **kwargs: Kwargs.
+
+        Returns:
+            Response (LoginResponse): Response.
         """
 
         kwargs["json"] = {"api_key": self.api_key, "secret_key": self.api_secret}
@@ -372,6 +591,12 @@ class AsyncClient(CoreClient):
         self.refresh_token = _["refresh"]
         self.access_token = _["access"]
 
+        if self._background_relogin:
+            self._schedule_relogin()
+
+        if self._background_refresh_token:
+            self._schedule_refresh()
+
         return _
 
     async def refresh_access_token(  # type: ignore[no-untyped-def, override]
@@ -389,6 +614,28 @@ class AsyncClient(CoreClient):
 
         References:
             [API Docs](https://docs.bitpin.ir/v1/docs/authentication/refresh_token)
+
+        Notes:
+            Concurrent calls share a single in-flight refresh request, so arguments of later callers are
+            ignored while one is pending.
+        """
+
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = self._create_task(self._refresh_access_token(refresh_token, **kwargs))
+        return await asyncio.shield(self._refresh_task)
+
+    async def _refresh_access_token(  # type: ignore[no-untyped-def]
+        self, refresh_token: t.OptionalStr = None, **kwargs
+    ) -> t.RefreshTokenResponse:
+        """
+        Send refresh token request and set access_token.
+
+        Args:
+            refresh_token (str): Refresh token.
+            **kwargs: Kwargs.
+
+        Returns:
+            Response (RefreshTokenResponse): Response.
         """
 
         kwargs["json"] = {"refresh": refresh_token or self.refresh_token}
@@ -396,6 +643,9 @@ class AsyncClient(CoreClient):
 
         self.access_token = _["access"]
 
+        if self._background_refresh_token:
+            self._schedule_refresh()
+
         return _
 
     # Deprecated Methods
@@ -411,6 +661,7 @@ class AsyncClient(CoreClient):
         )
 
     # Working Methods
+    @ttl_cached(300)
     async def get_currencies_info(  # type: ignore[no-untyped-def, override]
         self,
     ) -> t.CurrenciesInfo:
@@ -425,10 +676,13 @@ class AsyncClient(CoreClient):
 
         Notes:
             Rate limit: 10000/day or 200/minute if you are authenticated.
+
+            Response is cached for 5 minutes. Use `clear_cache` to drop cached responses.
         """
 
         return await self._get(self.CURRENCIES_LIST_URL)
 
+    @ttl_cached(300)
     async def get_markets_info(self) -> t.MarketsInfo:  # type: ignore[no-untyped-def, override]
         """
         Get markets info.
@@ -441,10 +695,13 @@ class AsyncClient(CoreClient):
 
         Notes:
             Rate limit: 10000/day or 200/minute if you are authenticated.
+
+            Response is cached for 5 minutes. Use `clear_cache` to drop cached responses.
         """
 
         return await self._get(self.MARKETS_LIST_URL)
 
+    @ttl_cached(2)
     async def get_tickers_info(self) -> t.DictStrAny:
         """
         Get tickets info.
@@ -457,6 +714,8 @@ class AsyncClient(CoreClient):
 
         Notes:
             Rate limit: 80/minute .
+
+            Response is cached for 2 seconds. Use `clear_cache` to drop cached responses.
         """
 
         return await self._get(self.TICKERS_LIST_URL)
@@ -488,7 +747,12 @@ class AsyncClient(CoreClient):
             Rate limit: 10000/day.
         """
 
-        kwargs["params"] = {k: str(v) for k, v in locals().items() if v is not None and k not in {"self", "kwargs"}}
+        params: t.DictStrAny = {}
+        for key, value in (("assets", assets), ("service", service), ("offset", offset), ("limit", limit)):
+            if value is not None:
+                params[key] = str(value)
+
+        kwargs["params"] = params
         return await self._get(self.WALLETS_URL, signed=True, **kwargs)
 
     async def get_orderbook(  # type: ignore[no-untyped-def, override]
@@ -511,11 +775,24 @@ class AsyncClient(CoreClient):
             Rate Limit: 60 Requests/minute
         """
 
-        return await self._get(  # type: ignore[return-value]
-            self.ORDERBOOK_URL.format(symbol, str(type)),
-            version=self.PUBLIC_API_VERSION_1,
+        return await self._request(  # type: ignore[return-value]
+            enums.RequestMethod.GET, self._create_symbol_uri(self.ORDERBOOK_URL, symbol), False
         )
 
+    async def get_orderbooks(self, symbols: list[str]) -> dict[str, t.OrderbookResponse]:
+        """
+        Get orderbooks of several symbols concurrently.
+
+        Args:
+            symbols (list[str]): i.e. [BTC_IRT, ETH_USDT]
+
+        Returns:
+            dict: Orderbook per symbol, in the order of `symbols`.
+        """
+
+        orderbooks = await asyncio.gather(*(self.get_orderbook(symbol) for symbol in symbols))
+        return dict(zip(symbols, orderbooks))
+
     async def get_recent_trades(self, symbol: str) -> t.RecentTradesInfo:  # type: ignore[no-untyped-def, override]
         """
         Get recent trades.
@@ -533,7 +810,9 @@ class AsyncClient(CoreClient):
             Rate Limit: 60 requests/minute
         """
 
-        return await self._get(self.RECENT_TRADES_URL.format(symbol))  # type: ignore[return-value]
+        return await self._request(  # type: ignore[return-value]
+            enums.RequestMethod.GET, self._create_symbol_uri(self.RECENT_TRADES_URL, symbol), False
+        )
 
     async def get_user_orders(  # type: ignore[no-untyped-def, override]
         self,
@@ -577,12 +856,45 @@ class AsyncClient(CoreClient):
             Rate Limit: 80 Requests/minute
         """
 
-        kwargs["params"] = kwargs.get("params", {})
-        kwargs["params"].update(
-            {k: str(v) for k, v in locals().items() if v is not None and k not in {"self", "kwargs"}}
+        params: t.DictStrAny = kwargs.setdefault("params", {})
+        self._update_params(
+            params,
+            self._USER_ORDERS_PARAMS,
+            (symbol, side, state, type, identifier, start, end, ids_in, identifiers_in, offset, limit),
         )
+
         return await self._get(self.ORDERS_URL, signed=True, **kwargs)  # type: ignore[return-value]
 
+    async def iter_user_orders(self, page_size: int = 100, **kwargs: t.t.Any) -> t.t.AsyncIterator[t.OpenOrder]:
+        """
+        Iterate over user orders, requesting them page by page.
+
+        Args:
+            page_size (int): Orders per request (maximum: 100). `limit` in `kwargs` is used instead if given.
+            **kwargs: Filters and kwargs of `get_user_orders`.
+
+        Yields:
+            dict: Order.
+
+        Raises:
+            ValueError: If page size is not between 1 and 100.
+
+        Notes:
+            Pages are fetched lazily, so stopping early saves the remaining requests.
+            `offset` is advanced to the smallest order ID of the previous page.
+        """
+
+        page_size = self._pop_page_size(page_size, kwargs)
+        offset = kwargs.pop("offset", None)
+        while True:
+            page = await self.get_user_orders(offset=offset, limit=page_size, **kwargs)
+            for order in page:
+                yield order
+
+            if len(page) < page_size:
+                return
+            offset = min(order["id"] for order in page)
+
     async def create_order(  # type: ignore[no-untyped-def, override]
         self,
         symbol: str,
@@ -622,18 +934,13 @@ class AsyncClient(CoreClient):
         """
 
         kwargs["json"] = {
-            "symbol": symbol,
-            "type": type,
-            "side": side,
-            "price": price,
-            "base_amount": base_amount,
-            "quote_amount": quote_amount,
-            "stop_price": stop_price,
-            "oco_target_price": oco_target_price,
-            "identifier": identifier,
+            key: value
+            for key, value in zip(
+                self._ORDER_FIELDS,
+                (symbol, type, side, price, base_amount, quote_amount, stop_price, oco_target_price, identifier),
+            )
+            if value is not None
         }
-
-        kwargs["json"] = {k: v for k, v in kwargs["json"].items() if v is not None}
         return await self._post(self.ORDERS_URL, signed=True, **kwargs)  # type: ignore[return-value]
 
     async def cancel_order(  # type: ignore[no-untyped-def, override]
@@ -692,19 +999,52 @@ class AsyncClient(CoreClient):
             Rate Limit: 1800 Requests/hour
         """
 
-        max_orders = 10
-        if len(orders) > max_orders:
-            msg = "A maximum of 10 orders can be placed at a time! not creating order!"
+        if not orders:
+            msg = "No orders provided! not creating order!"
             raise ValueError(msg)
 
-        market = orders[0]["symbol"] if orders else None
-        if any(order["symbol"] != market for order in orders):
-            msg = "All orders must be in the same market! not creating order!"
+        if len(orders) > self.MAX_BULK_ORDERS:
+            msg = f"A maximum of {self.MAX_BULK_ORDERS} orders can be placed at a time! not creating order!"
             raise ValueError(msg)
 
-        kwargs["json"] = {k: str(v) for k, v in locals().items() if v is not None and k not in {"self", "kwargs"}}
+        market = orders[0]["symbol"]
+        for order in orders[1:]:
+            if order["symbol"] != market:
+                msg = "All orders must be in the same market! not creating order!"
+                raise ValueError(msg)
+
+        kwargs["json"] = {"orders": orders}
         return await self._post(self.BULK_ORDER_URL, signed=True, **kwargs)  # type: ignore[return-value]
 
+    async def create_orders_parallel(  # type: ignore[no-untyped-def]
+        self, orders: t.BulkOrderList, **kwargs
+    ) -> list[t.t.Any]:
+        """
+        Create orders across markets concurrently.
+
+        Args:
+            orders (BulkOrderList): A list of order objects, possibly in different markets.
+            **kwargs: Additional parameters to be passed in each request.
+
+        Returns:
+            list: Response or raised exception of each batch, in the order batches were submitted.
+
+        Notes:
+            Orders are grouped by market and split into batches of up to 10 orders.
+            A batch of a single order is placed with `create_order`, larger batches with `create_order_bulk`.
+            Batches are awaited together over the shared session.
+            A failed batch does not stop the others, every batch is awaited and a failure is returned in its place,
+            so callers can tell which orders were placed.
+        """
+
+        return await asyncio.gather(
+            *(
+                self.create_order(**batch[0], **kwargs) if len(batch) == 1 else self.create_order_bulk(batch, **kwargs)
+                for batch in self._batch_orders(orders)
+            ),
+            return_exceptions=True,
+        )
+
     async def cancel_order_bulk(
         self,
         ids: t.OptionalStrList = None,
@@ -726,7 +1066,13 @@ class AsyncClient(CoreClient):
             [API Docs](https://docs.bitpin.ir/v1/docs/order/Bulk%20Orders/Cancel_Bulk_Orders)
         """
 
-        kwargs["json"] = {k: str(v) for k, v in locals().items() if v is not None and k not in {"self", "kwargs"}}
+        payload: t.DictStrAny = {}
+        if ids is not None:
+            payload["ids"] = ids
+        if identifiers is not None:
+            payload["identifiers"] = identifiers
+
+        kwargs["json"] = payload
         return await self._delete(self.BULK_ORDER_URL, signed=True, **kwargs)  # type: ignore[return-value]
 
     async def get_user_trades(  # type: ignore[no-untyped-def, override]
@@ -757,14 +1103,84 @@ class AsyncClient(CoreClient):
             Rate Limit: 80 Requests/minute
         """
 
-        kwargs["params"] = kwargs.get("params", {})
-        kwargs["params"].update(
-            {k: str(v) for k, v in locals().items() if v is not None and k not in {"self", "kwargs"}}
-        )
+        params: t.DictStrAny = kwargs.setdefault("params", {})
+        self._update_params(params, self._USER_TRADES_PARAMS, (symbol, side, offset, limit))
 
-        return await self._get(self.ORDERS_URL, signed=True, **kwargs)  # type: ignore[return-value]
+        return await self._get(self.FILLED_ORDERS_URL, signed=True, **kwargs)  # type: ignore[return-value]
+
+    async def iter_user_trades(self, page_size: int = 100, **kwargs: t.t.Any) -> t.t.AsyncIterator[t.Trade]:
+        """
+        Iterate over user trades, requesting them page by page.
+
+        Args:
+            page_size (int): Trades per request (maximum: 100). `limit` in `kwargs` is used instead if given.
+            **kwargs: Filters and kwargs of `get_user_trades`.
+
+        Yields:
+            dict: Trade.
+
+        Raises:
+            ValueError: If page size is not between 1 and 100.
+
+        Notes:
+            Pages are fetched lazily, so stopping early saves the remaining requests.
+            `offset` is advanced by the smallest order ID of the previous page, without skipping trades of that order.
+        """
+
+        page_size = self._pop_page_size(page_size, kwargs)
+        offset = kwargs.pop("offset", None)
+        seen: set[int] = set()
+        while True:
+            page = await self.get_user_trades(offset=offset, limit=page_size, **kwargs)
+            trades = [trade for trade in page if trade["id"] not in seen]
+            for trade in trades:
+                yield trade
+
+            if len(page) < page_size:
+                return
+            offset, seen = self._next_trades_offset(page, bool(trades))
+
+    async def warm_up(self) -> None:
+        """
+        Open a pooled connection to the API host ahead of the first call.
+
+        Notes:
+            Sends a HEAD request so DNS resolution and the TLS handshake happen now instead of on the first API call.
+            The connection is kept alive in the connector pool and reused by later requests.
+        """
+
+        if self.session is None or self.session.closed:
+            self.session = self._init_session()
+
+        async with self.session.head(self.API_URL, **self._base_kwargs):
+            pass
+
+    def clear_cache(self) -> None:
+        """Clear cached responses of currencies, markets and tickers info."""
+
+        self._ttl_cache.clear()
 
     async def close_connection(self) -> None:  # type: ignore[override]
         """Close connection."""
 
-        await self.session.close()  # type: ignore[misc]
+        self._background_relogin = False
+        self._background_refresh_token = False
+
+        for handle in (self._relogin_handle, self._refresh_handle):
+            if handle is not None:
+                handle.cancel()
+        self._relogin_handle = self._refresh_handle = None
+
+        for task in self._background_tasks:
+            task.cancel()
+        self._background_tasks.clear()
+
+        for in_flight in (self._login_task, self._refresh_task):
+            if in_flight is not None and not in_flight.done():
+                in_flight.cancel()
+                with suppress(asyncio.CancelledError):
+                    await in_flight
+        self._login_task = self._refresh_task = None
+
+        if self.session is not None:
+            await self.session.close()
@@ -1,13 +1,29 @@
 """# Bitpin Client."""
 
+import sched
 import time
-from threading import Thread
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    wait,
+)
+from threading import (
+    Event,
+    Lock,
+    Thread,
+    current_thread,
+)
 from warnings import warn
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .. import enums
 from .. import response_types as t
+from .._utils import (
+    json_loads,
+    ttl_cached,
+)
 from ..exceptions import (
     APIException,
     RequestException,
@@ -27,21 +43,48 @@ class Client(CoreClient):
         get_markets_info: Get markets info.
         get_wallets: Get wallets.
         get_orderbook: Get orderbook.
+        get_orderbooks: Get orderbooks of several symbols concurrently.
         get_recent_trades: Get recent trades.
         get_user_orders: Get use orders.
+        iter_user_orders: Iterate over user orders page by page.
         create_order: Create order.
         cancel_order: Cancel order.
+        create_order_bulk: Create Bulk Order.
+        create_orders_parallel: Create orders across markets concurrently.
+        cancel_order_bulk: Cancel Bulk Order.
         get_user_trades: Get user trades.
+        iter_user_trades: Iterate over user trades page by page.
+        warm_up: Open a pooled connection ahead of the first call.
         close_connection: Close connection.
 
     Attributes:
-        session (aiohttp.ClientSession): Session.
+        session (requests.Session): Session.
         api_key (str): API key.
         api_secret (str): API secret.
         refresh_token (str): Refresh token.
         access_token (str): Access token.
+
+    Notes:
+        Every call blocks until its response arrives. For many concurrent calls use `AsyncClient`,
+        which overlaps them on one event loop over a single pooled `aiohttp.ClientSession`.
     """
 
+    __slots__ = (
+        "_executor",
+        "_max_workers",
+        "_ttl_cache",
+        "_token_lock",
+        "_stop_event",
+        "_scheduler",
+        "_scheduler_thread",
+        "_session_methods",
+    )
+
+    POOL_CONNECTIONS = 32
+    POOL_MAXSIZE = 64
+    MAX_RETRIES = 3
+    RETRY_BACKOFF_FACTOR: float = 0.3
+
     def __init__(  # type: ignore[no-untyped-def]
         self,
         api_key: t.OptionalStr = None,
@@ -53,6 +96,7 @@ class Client(CoreClient):
         background_relogin_interval: int = 60 * 60 * 24 * 6,
         background_refresh_token: bool = False,
         background_refresh_token_interval: int = 60 * 13,
+        max_workers: int = 8,
     ):
         """
         Constructor.
@@ -67,6 +111,7 @@ class Client(CoreClient):
             background_relogin_interval (int): Background refresh interval.
             background_refresh_token (bool): Background refresh token.
             background_refresh_token_interval (int): Background refresh token interval.
+            max_workers (int): Maximum number of worker threads of `get_orderbooks` and `create_orders_parallel`.
 
         Notes:
             If `api_key` and `api_secret` are not provided, they will be read from the environment variables
@@ -75,6 +120,8 @@ class Client(CoreClient):
             If `access_token` and `refresh_token` are not provided, they will be read from the environment variables
             `BITPIN_ACCESS_TOKEN` and `BITPIN_REFRESH_TOKEN` respectively.
 
+            Environment variables are read once per process, call `bitpin.envs.refresh()` after changing them.
+
             If `requests_params` are provided, they will be used as default for every request.
 
             If `requests_params` are provided in `kwargs`, they will override existing `requests_params`.
@@ -98,20 +145,69 @@ class Client(CoreClient):
             background_refresh_token_interval,
         )
 
+        self._executor: t.t.Optional[ThreadPoolExecutor] = None
+        self._max_workers = max_workers
+        self._ttl_cache: dict[str, tuple[float, t.t.Any]] = {}
+        self._token_lock = Lock()
+        self._stop_event = Event()
+        self._scheduler = sched.scheduler(time.monotonic, time.sleep)
+        self._scheduler_thread: t.t.Optional[Thread] = None
+        self.session = self._init_session()
+        self._session_methods: dict[str, t.t.Callable[..., requests.Response]] = {
+            enums.RequestMethod.GET: self.session.get,
+            enums.RequestMethod.POST: self.session.post,
+            enums.RequestMethod.PUT: self.session.put,
+            enums.RequestMethod.DELETE: self.session.delete,
+        }
         self._handle_login()
 
+    def __enter__(self) -> "Client":
+        """
+        Enter context.
+
+        Returns:
+            Client: Client.
+        """
+
+        return self
+
+    def __exit__(self, *args: t.t.Any) -> None:
+        """Exit context and close connection."""
+
+        self.close_connection()
+
     def _init_session(self) -> requests.Session:
         """
         Initialize session.
 
         Returns:
-            session (aiohttp.ClientSession): Session.
+            session (requests.Session): Session.
+
+        Notes:
+            Session mounts a keep-alive connection pool that is reused by every request.
 
+            Only idempotent requests (GET/DELETE) are retried on 429/502/503/504, so orders are never placed twice.
+            Retries on 429 honor the `Retry-After` header.
         """
 
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=Retry(
+                total=self.MAX_RETRIES,
+                backoff_factor=self.RETRY_BACKOFF_FACTOR,
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=frozenset(("GET", "DELETE")),
+                raise_on_status=False,
+            ),
+        )
+
         session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         session.headers["Content-Type"] = "application/json"
         session.headers["Accept"] = "application/json"
+        session.headers["User-Agent"] = self.USER_AGENT
         return session
 
     def _get(  # type: ignore[no-untyped-def]
@@ -223,9 +319,12 @@ class Client(CoreClient):
 
         kwargs = self._get_request_kwargs(method, signed, **kwargs)
 
-        with getattr(self.session, method)(uri, **kwargs) as response:
-            self.response = response  # pylint: disable=attribute-defined-outside-init
+        response = self._session_methods[method](uri, **kwargs)
+        self.response = response
+        try:
             return self._handle_response(response)
+        finally:
+            response.close()
 
     @staticmethod
     def _handle_response(response: requests.Response) -> t.DictStrAny:  # type: ignore[override]
@@ -241,17 +340,20 @@ class Client(CoreClient):
         Raises:
             APIException: API Exception.
             RequestException: Request Exception.
+
+        Notes:
+            A successful DELETE without a body (i.e. 204) returns a success result with the ID from the URL.
         """
 
-        if not str(response.status_code).startswith("2"):
-            if response.request.method.lower() == enums.RequestMethod.DELETE:  # type: ignore[union-attr]
-                return {
-                    "status": "success",
-                    "id": response.request.path_url.split("/")[-2],
-                }
-            raise APIException(response, response.status_code, response.text)
+        if not 200 <= response.status_code < 300:
+            raise APIException(response, response.status_code, response.content)
+        if response.request.method == "DELETE" and (response.status_code == 204 or not response.content):
+            return {
+                "status": "success",
+                "id": response.request.path_url.rsplit("/", 2)[-2],
+            }
         try:
-            return response.json()  # type: ignore[no-any-return]
+            return json_loads(response.content)  # type: ignore[no-any-return]
         except ValueError as exc:
             msg = f"Invalid Response: {response.text}"
             raise RequestException(msg) from exc
@@ -259,34 +361,80 @@ class Client(CoreClient):
     def _handle_login(self) -> None:
         """Handle login."""
 
-        if self.api_key and self.api_secret:
+        logged_in = bool(self.api_key and self.api_secret)
+        if logged_in:
             self.login()
 
+        if self._background_relogin or self._background_refresh_token:
+            self._scheduler_thread = Thread(target=self._run_scheduler, args=(logged_in,), daemon=True)
+            self._scheduler_thread.start()
+
+    def _run_scheduler(self, logged_in: bool) -> None:
+        """
+        Run background relogin and refresh token tasks on a single thread.
+
+        Args:
+            logged_in (bool): Whether login already happened, so the first run waits a full interval.
+        """
+
+        scheduler = self._scheduler
+
         if self._background_relogin:
-            Thread(target=self._background_relogin_task, daemon=True).start()
+            scheduler.enter(self._background_relogin_interval if logged_in else 0, 1, self._background_relogin_task)
 
         if self._background_refresh_token:
-            Thread(target=self._background_refresh_token_task, daemon=True).start()
+            scheduler.enter(
+                self._background_refresh_token_interval if logged_in else 0, 2, self._background_refresh_token_task
+            )
 
-    def _background_relogin_task(self) -> None:
-        """Background relogin task."""
+        while not self._stop_event.is_set():
+            delay = scheduler.run(blocking=False)
+            if delay is None or self._stop_event.wait(delay):
+                break
 
-        while True:
-            try:
-                self.login()
-                time.sleep(self._background_relogin_interval)
-            except Exception:  # pylint: disable=broad-except
-                continue
+    def _background_relogin_task(self, attempt: int = 0) -> None:
+        """
+        Background relogin task, re-enqueued on the client's scheduler.
+
+        Args:
+            attempt (int): Number of consecutive failures.
+        """
 
-    def _background_refresh_token_task(self) -> None:
-        """Background refresh token task."""
+        if self._stop_event.is_set():
+            return
 
-        while True:
-            try:
-                self.refresh_access_token()
-                time.sleep(self._background_refresh_token_interval)
-            except Exception:  # pylint: disable=broad-except
-                continue
+        try:
+            self.login()
+        except Exception:  # pylint: disable=broad-except
+            attempt += 1
+            delay = min(self.BACKGROUND_RETRY_MAX_DELAY, 2**attempt)
+        else:
+            attempt = 0
+            delay = self._background_relogin_interval
+
+        self._scheduler.enter(delay, 1, self._background_relogin_task, (attempt,))
+
+    def _background_refresh_token_task(self, attempt: int = 0) -> None:
+        """
+        Background refresh token task, re-enqueued on the client's scheduler.
+
+        Args:
+            attempt (int): Number of consecutive failures.
+        """
+
+        if self._stop_event.is_set():
+            return
+
+        try:
+            self.refresh_access_token()
+        except Exception:  # pylint: disable=broad-except
+            attempt += 1
+            delay = min(self.BACKGROUND_RETRY_MAX_DELAY, 2**attempt)
+        else:
+            attempt = 0
+            delay = self._background_refresh_token_interval
+
+        self._scheduler.enter(delay, 2, self._background_refresh_token_task, (attempt,))
 
     def login(self, **kwargs) -> t.LoginResponse:  # type: ignore[no-untyped-def, override]
         """
@@ -300,15 +448,24 @@ class Client(CoreClient):
 
         References:
             [API Docs](https://docs.bitpin.ir/v1/docs/authentication/intro)
+
+        Notes:
+            Concurrent calls are serialized. Callers that waited while another thread logged in
+            get the fresh tokens without sending another request.
         """
 
-        kwargs["json"] = {"api_key": self.api_key, "secret_key": self.api_secret}
-        _: t.LoginResponse = self._post(self.LOGIN_URL, **kwargs)  # type: ignore[assignment]
+        stale_refresh_token = self.refresh_token
+        with self._token_lock:
+            if self.refresh_token != stale_refresh_token:
+                return {"refresh": self.refresh_token, "access": self.access_token}  # type: ignore[typeddict-item]
+
+            kwargs["json"] = {"api_key": self.api_key, "secret_key": self.api_secret}
+            _: t.LoginResponse = self._post(self.LOGIN_URL, **kwargs)  # type: ignore[assignment]
 
-        self.refresh_token = _["refresh"]
-        self.access_token = _["access"]
+            self.refresh_token = _["refresh"]
+            self.access_token = _["access"]
 
-        return _
+            return _
 
     def refresh_access_token(  # type: ignore[no-untyped-def, override]
         self, refresh_token: t.OptionalStr = None, **kwargs
@@ -325,14 +482,23 @@ class Client(CoreClient):
 
         References:
             [API Docs](https://docs.bitpin.ir/v1/docs/authentication/refresh_token)
+
+        Notes:
+            Concurrent calls are serialized. Callers that waited while another thread refreshed
+            the access token get the fresh token without sending another request.
         """
 
-        kwargs["json"] = {"refresh": refresh_token or self.refresh_token}
-        _: t.RefreshTokenResponse = self._post(self.REFRESH_TOKEN_URL, **kwargs)  # type: ignore[assignment]
+        stale_access_token = self.access_token
+        with self._token_lock:
+            if self.access_token != stale_access_token:
+                return {"access": self.access_token}  # type: ignore[typeddict-item]
+
+            kwargs["json"] = {"refresh": refresh_token or self.refresh_token}
+            _: t.RefreshTokenResponse = self._post(self.REFRESH_TOKEN_URL, **kwargs)  # type: ignore[assignment]
 
-        self.access_token = _["access"]
+            self.access_token = _["access"]
 
-        return _
+            return _
 
     # Deprecated Methods
     def get_user_info(self, **kwargs) -> None:  # type: ignore[no-untyped-def, override]
@@ -347,6 +513,7 @@ class Client(CoreClient):
         )
 
     # Working Methods
+    @ttl_cached(300)
     def get_currencies_info(  # type: ignore[no-untyped-def, override]
         self,
     ) -> t.CurrenciesInfo:
@@ -361,10 +528,13 @@ class Client(CoreClient):
 
         Notes:
             Rate limit: 10000/day or 200/minute if you are authenticated.
+
+            Response is cached for 5 minutes. Use `clear_cache` to drop cached responses.
         """
 
         return self._get(self.CURRENCIES_LIST_URL)
 
+    @ttl_cached(300)
     def get_markets_info(self) -> t.MarketsInfo:  # type: ignore[no-untyped-def, override]
         """
         Get markets info.
@@ -377,10 +547,13 @@ class Client(CoreClient):
 
         Notes:
             Rate limit: 10000/day or 200/minute if you are authenticated.
+
+            Response is cached for 5 minutes. Use `clear_cache` to drop cached responses.
         """
 
         return self._get(self.MARKETS_LIST_URL)
 
+    @ttl_cached(2)
     def get_tickers_info(self) -> t.DictStrAny:
         """
         Get tickets info.
@@ -393,6 +566,8 @@ class Client(CoreClient):
 
         Notes:
             Rate limit: 80/minute .
+
+            Response is cached for 2 seconds. Use `clear_cache` to drop cached responses.
         """
 
         return self._get(self.TICKERS_LIST_URL)
@@ -424,7 +599,12 @@ class Client(CoreClient):
             Rate limit: 10000/day.
         """
 
-        kwargs["params"] = {k: str(v) for k, v in locals().items() if v is not None and k not in {"self", "kwargs"}}
+        params: t.DictStrAny = {}
+        for key, value in (("assets", assets), ("service", service), ("offset", offset), ("limit", limit)):
+            if value is not None:
+                params[key] = str(value)
+
+        kwargs["params"] = params
         return self._get(self.WALLETS_URL, signed=True, **kwargs)
 
     def get_orderbook(  # type: ignore[no-untyped-def, override]
@@ -447,11 +627,28 @@ class Client(CoreClient):
             Rate Limit: 60 Requests/minute
         """
 
-        return self._get(  # type: ignore[return-value]
-            self.ORDERBOOK_URL.format(symbol, str(type)),
-            version=self.PUBLIC_API_VERSION_1,
+        return self._request(  # type: ignore[return-value]
+            enums.RequestMethod.GET, self._create_symbol_uri(self.ORDERBOOK_URL, symbol), False
         )
 
+    def get_orderbooks(self, symbols: list[str]) -> dict[str, t.OrderbookResponse]:
+        """
+        Get orderbooks of several symbols concurrently.
+
+        Args:
+            symbols (list[str]): i.e. [BTC_IRT, ETH_USDT]
+
+        Returns:
+            dict: Orderbook per symbol, in the order of `symbols`.
+
+        Notes:
+            Requests are dispatched over the thread pool shared with `create_orders_parallel`.
+        """
+
+        executor = self._get_executor()
+        futures = [executor.submit(self.get_orderbook, symbol) for symbol in symbols]
+        return {symbol: future.result() for symbol, future in zip(symbols, futures)}
+
     def get_recent_trades(self, symbol: str) -> t.RecentTradesInfo:  # type: ignore[no-untyped-def, override]
         """
         Get recent trades.
@@ -469,7 +666,9 @@ class Client(CoreClient):
             Rate Limit: 60 requests/minute
         """
 
-        return self._get(self.RECENT_TRADES_URL.format(symbol))  # type: ignore[return-value]
+        return self._request(  # type: ignore[return-value]
+            enums.RequestMethod.GET, self._create_symbol_uri(self.RECENT_TRADES_URL, symbol), False
+        )
 
     def get_user_orders(  # type: ignore[no-untyped-def, override]
         self,
@@ -513,12 +712,44 @@ class Client(CoreClient):
             Rate Limit: 80 Requests/minute
         """
 
-        kwargs["params"] = kwargs.get("params", {})
-        kwargs["params"].update(
-            {k: str(v) for k, v in locals().items() if v is not None and k not in {"self", "kwargs"}}
+        params: t.DictStrAny = kwargs.setdefault("params", {})
+        self._update_params(
+            params,
+            self._USER_ORDERS_PARAMS,
+            (symbol, side, state, type, identifier, start, end, ids_in, identifiers_in, offset, limit),
         )
+
         return self._get(self.ORDERS_URL, signed=True, **kwargs)  # type: ignore[return-value]
 
+    def iter_user_orders(self, page_size: int = 100, **kwargs: t.t.Any) -> t.t.Iterator[t.OpenOrder]:
+        """
+        Iterate over user orders, requesting them page by page.
+
+        Args:
+            page_size (int): Orders per request (maximum: 100). `limit` in `kwargs` is used instead if given.
+            **kwargs: Filters and kwargs of `get_user_orders`.
+
+        Yields:
+            dict: Order.
+
+        Raises:
+            ValueError: If page size is not between 1 and 100.
+
+        Notes:
+            Pages are fetched lazily, so stopping early saves the remaining requests.
+            `offset` is advanced to the smallest order ID of the previous page.
+        """
+
+        page_size = self._pop_page_size(page_size, kwargs)
+        offset = kwargs.pop("offset", None)
+        while True:
+            page = self.get_user_orders(offset=offset, limit=page_size, **kwargs)
+            yield from page
+
+            if len(page) < page_size:
+                return
+            offset = min(order["id"] for order in page)
+
     def create_order(  # type: ignore[no-untyped-def, override]
         self,
         symbol: str,
@@ -558,18 +789,13 @@ class Client(CoreClient):
         """
 
         kwargs["json"] = {
-            "symbol": symbol,
-            "type": type,
-            "side": side,
-            "price": price,
-            "base_amount": base_amount,
-            "quote_amount": quote_amount,
-            "stop_price": stop_price,
-            "oco_target_price": oco_target_price,
-            "identifier": identifier,
+            key: value
+            for key, value in zip(
+                self._ORDER_FIELDS,
+                (symbol, type, side, price, base_amount, quote_amount, stop_price, oco_target_price, identifier),
+            )
+            if value is not None
         }
-
-        kwargs["json"] = {k: v for k, v in kwargs["json"].items() if v is not None}
         return self._post(self.ORDERS_URL, signed=True, **kwargs)  # type: ignore[return-value]
 
     def cancel_order(self, order_id: str, **kwargs) -> t.CancelOrderResponse:  # type: ignore[no-untyped-def, override]
@@ -626,19 +852,68 @@ class Client(CoreClient):
             Rate Limit: 1800 Requests/hour
         """
 
-        max_orders = 10
-        if len(orders) > max_orders:
-            msg = "A maximum of 10 orders can be placed at a time! not creating order!"
+        if not orders:
+            msg = "No orders provided! not creating order!"
             raise ValueError(msg)
 
-        market = orders[0]["symbol"] if orders else None
-        if any(order["symbol"] != market for order in orders):
-            msg = "All orders must be in the same market! not creating order!"
+        if len(orders) > self.MAX_BULK_ORDERS:
+            msg = f"A maximum of {self.MAX_BULK_ORDERS} orders can be placed at a time! not creating order!"
             raise ValueError(msg)
 
-        kwargs["json"] = {k: str(v) for k, v in locals().items() if v is not None and k not in {"self", "kwargs"}}
+        market = orders[0]["symbol"]
+        for order in orders[1:]:
+            if order["symbol"] != market:
+                msg = "All orders must be in the same market! not creating order!"
+                raise ValueError(msg)
+
+        kwargs["json"] = {"orders": orders}
         return self._post(self.BULK_ORDER_URL, signed=True, **kwargs)  # type: ignore[return-value]
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get thread pool of `max_workers` threads, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor: Executor.
+        """
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="bitpin")
+        return self._executor
+
+    def create_orders_parallel(  # type: ignore[no-untyped-def]
+        self, orders: t.BulkOrderList, **kwargs
+    ) -> list[t.t.Any]:
+        """
+        Create orders across markets concurrently.
+
+        Args:
+            orders (BulkOrderList): A list of order objects, possibly in different markets.
+            **kwargs: Additional parameters to be passed in each request.
+
+        Returns:
+            list: Response or raised exception of each batch, in the order batches were submitted.
+
+        Notes:
+            Orders are grouped by market and split into batches of up to 10 orders.
+            A batch of a single order is placed with `create_order`, larger batches with `create_order_bulk`.
+            Batches are dispatched over a thread pool sharing the client session.
+            A failed batch does not stop the others, every batch is waited for and a failure is returned in its place,
+            so callers can tell which orders were placed.
+        """
+
+        executor = self._get_executor()
+
+        futures = []
+        for batch in self._batch_orders(orders):
+            if len(batch) == 1:
+                futures.append(executor.submit(self.create_order, **batch[0], **kwargs))
+            else:
+                futures.append(executor.submit(self.create_order_bulk, batch, **kwargs))
+
+        wait(futures)
+        return [future.exception() or future.result() for future in futures]
+
     def cancel_order_bulk(
         self,
         ids: t.OptionalStrList = None,
@@ -660,7 +935,13 @@ class Client(CoreClient):
             [API Docs](https://docs.bitpin.ir/v1/docs/order/Bulk%20Orders/Cancel_Bulk_Orders)
         """
 
-        kwargs["json"] = {k: str(v) for k, v in locals().items() if v is not None and k not in {"self", "kwargs"}}
+        payload: t.DictStrAny = {}
+        if ids is not None:
+            payload["ids"] = ids
+        if identifiers is not None:
+            payload["identifiers"] = identifiers
+
+        kwargs["json"] = payload
         return self._delete(self.BULK_ORDER_URL, signed=True, **kwargs)  # type: ignore[return-value]
 
     def get_user_trades(  # type: ignore[no-untyped-def, override]
@@ -691,23 +972,74 @@ class Client(CoreClient):
             Rate Limit: 80 Requests/minute
         """
 
-        kwargs["params"] = kwargs.get("params", {})
-        kwargs["params"].update(
-            {
-                k: str(v)
-                for k, v in locals().items()
-                if v is not None
-                and k
-                not in {
-                    "self",
-                    "kwargs",
-                }
-            }
-        )
+        params: t.DictStrAny = kwargs.setdefault("params", {})
+        self._update_params(params, self._USER_TRADES_PARAMS, (symbol, side, offset, limit))
 
-        return self._get(self.ORDERS_URL, signed=True, **kwargs)  # type: ignore[return-value]
+        return self._get(self.FILLED_ORDERS_URL, signed=True, **kwargs)  # type: ignore[return-value]
+
+    def iter_user_trades(self, page_size: int = 100, **kwargs: t.t.Any) -> t.t.Iterator[t.Trade]:
+        """
+        Iterate over user trades, requesting them page by page.
+
+        Args:
+            page_size (int): Trades per request (maximum: 100). `limit` in `kwargs` is used instead if given.
+            **kwargs: Filters and kwargs of `get_user_trades`.
+
+        Yields:
+            dict: Trade.
+
+        Raises:
+            ValueError: If page size is not between 1 and 100.
+
+        Notes:
+            Pages are fetched lazily, so stopping early saves the remaining requests.
+            `offset` is advanced by the smallest order ID of the previous page, without skipping trades of that order.
+        """
+
+        page_size = self._pop_page_size(page_size, kwargs)
+        offset = kwargs.pop("offset", None)
+        seen: set[int] = set()
+        while True:
+            page = self.get_user_trades(offset=offset, limit=page_size, **kwargs)
+            trades = [trade for trade in page if trade["id"] not in seen]
+            yield from trades
+
+            if len(page) < page_size:
+                return
+            offset, seen = self._next_trades_offset(page, bool(trades))
+
+    def warm_up(self) -> None:
+        """
+        Open a pooled connection to the API host ahead of the first call.
+
+        Notes:
+            Sends a HEAD request so DNS resolution and the TLS handshake happen now instead of on the first API call.
+            The connection is kept alive in the session pool and reused by later requests.
+        """
+
+        self.session.head(self.API_URL, **self._base_kwargs).close()
+
+    def clear_cache(self) -> None:
+        """Clear cached responses of currencies, markets and tickers info."""
+
+        self._ttl_cache.clear()
 
     def close_connection(self) -> None:  # type: ignore[override]
-        """Close connection."""
+        """
+        Close connection.
+
+        Notes:
+            Background relogin/refresh token thread is stopped and joined, waiting at most `REQUEST_TIMEOUT`
+            seconds for an in-flight token request to finish.
+        """
+
+        self._stop_event.set()
+        if self._scheduler_thread is not None and self._scheduler_thread is not current_thread():
+            self._scheduler_thread.join(self.REQUEST_TIMEOUT)
+            self._scheduler_thread = None
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
         self.session.close()  # type: ignore[misc]
@@ -1,23 +1,51 @@
 """# Core Client."""
 
-import os
 from abc import (
     ABC,
     abstractmethod,
 )
+from types import MappingProxyType
 
+from .. import (
+    __version__,
+    envs,
+)
 from .. import response_types as t
+from .._utils import json_dumps_bytes
 
 
 class CoreClient(ABC):  # pylint: disable=too-many-instance-attributes
     """Core Client."""
 
+    __slots__ = (
+        "api_key",
+        "api_secret",
+        "_access_token",
+        "_auth_headers",
+        "refresh_token",
+        "session",
+        "response",
+        "_background_relogin",
+        "_background_relogin_interval",
+        "_background_refresh_token",
+        "_background_refresh_token_interval",
+        "_base_kwargs",
+        "_base_uris",
+        "_uri_cache",
+        "_symbol_uri_cache",
+    )
+
     API_URL = "https://api.bitpin.ir/api"
+    USER_AGENT = f"python-bitpin/{__version__}"
 
     PUBLIC_API_VERSION_1 = "v1"
     PUBLIC_API_VERSION_2 = "v2"
 
     REQUEST_TIMEOUT: float = 10
+    MAX_BULK_ORDERS = 10
+    BACKGROUND_RETRY_MAX_DELAY: float = 60
+    URI_CACHE_MAX_SIZE = 512
+    MAX_PAGE_SIZE = 100
 
     LOGIN_URL = "usr/authenticate/"
     REFRESH_TOKEN_URL = "usr/refresh_token/"
@@ -32,6 +60,32 @@ class CoreClient(ABC):  # pylint: disable=too-many-instance-attributes
     USER_TRADES_URL = "odr/matches/?type={}"
     BULK_ORDER_URL = "odr/orders/bulk/"
 
+    _USER_ORDERS_PARAMS = (
+        "symbol",
+        "side",
+        "state",
+        "type",
+        "identifier",
+        "start",
+        "end",
+        "ids_in",
+        "identifiers_in",
+        "offset",
+        "limit",
+    )
+    _USER_TRADES_PARAMS = ("symbol", "side", "offset", "limit")
+    _ORDER_FIELDS = (
+        "symbol",
+        "type",
+        "side",
+        "price",
+        "base_amount",
+        "quote_amount",
+        "stop_price",
+        "oco_target_price",
+        "identifier",
+    )
+
     def __init__(  # type: ignore[no-untyped-def]
         self,
         api_key: t.OptionalStr = None,
@@ -76,56 +130,208 @@ class CoreClient(ABC):  # pylint: disable=too-many-instance-attributes
             `background_refresh_token_interval` seconds.
         """
 
-        self.api_key = api_key or os.environ.get("BITPIN_API_KEY")
-        self.api_secret = api_secret or os.environ.get("BITPIN_API_SECRET")
-        self.access_token: t.OptionalStr = access_token or os.environ.get("BITPIN_ACCESS_TOKEN")
-        self.refresh_token: t.OptionalStr = refresh_token or os.environ.get("BITPIN_REFRESH_TOKEN")
+        self.api_key = api_key or envs.api_key()
+        self.api_secret = api_secret or envs.api_secret()
+        self.access_token = access_token or envs.access_token()
+        self.refresh_token: t.OptionalStr = refresh_token or envs.refresh_token()
 
         self._background_relogin = background_relogin
         self._background_relogin_interval = background_relogin_interval
         self._background_refresh_token = background_refresh_token
         self._background_refresh_token_interval = background_refresh_token_interval
 
-        self._requests_params = requests_params
-        self.session = self._init_session()
+        self.response: t.t.Optional[t.HttpResponses] = None
+
+        self._base_kwargs: t.DictStrAny = {"timeout": self.REQUEST_TIMEOUT, **(requests_params or {})}
+        self._base_uris = {
+            version: f"{self.API_URL}/{version}/" for version in (self.PUBLIC_API_VERSION_1, self.PUBLIC_API_VERSION_2)
+        }
+        self._uri_cache: dict[tuple[str, str], str] = {
+            (path, version): base_uri + path
+            for version, base_uri in self._base_uris.items()
+            for path in (
+                self.LOGIN_URL,
+                self.REFRESH_TOKEN_URL,
+                self.CURRENCIES_LIST_URL,
+                self.MARKETS_LIST_URL,
+                self.TICKERS_LIST_URL,
+                self.WALLETS_URL,
+                self.ORDERS_URL,
+                self.FILLED_ORDERS_URL,
+                self.BULK_ORDER_URL,
+            )
+        }
+        self._symbol_uri_cache: dict[tuple[str, str], str] = {}
+
+    @property
+    def access_token(self) -> t.OptionalStr:
+        """
+        Access token.
+
+        Returns:
+            str: Access token.
+        """
+
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, value: t.OptionalStr) -> None:
+        """
+        Set access token and rebuild authorization headers.
+
+        Args:
+            value (str): Access token.
+
+        Notes:
+            Headers are read-only since signed requests without extra headers share them.
+        """
+
+        self._access_token = value
+        self._auth_headers: t.t.Mapping[str, str] = MappingProxyType({"Authorization": f"Bearer {value}"})
 
     def _get_request_kwargs(
         self, method: t.RequestMethods, signed: bool, **kwargs
     ) -> t.DictStrAny:  # type: ignore[no-untyped-def]
-        kwargs["timeout"] = self.REQUEST_TIMEOUT
-
-        if self._requests_params:
-            kwargs.update(self._requests_params)
+        kwargs = {**self._base_kwargs, **kwargs}
 
         data = kwargs.get("data")
-        if data and isinstance(data, dict):
-            kwargs["data"] = data
-
-            if "requests_params" in kwargs["data"]:
-                kwargs.update(kwargs["data"]["requests_params"])
-                del kwargs["data"]["requests_params"]
+        if data and isinstance(data, dict) and "requests_params" in data:
+            kwargs.update(data.pop("requests_params"))
 
         if signed is True:
-            headers: t.DictStrAny = kwargs.get("headers", {})
-            headers.update({"Authorization": f"Bearer {self.access_token}"})
-            kwargs["headers"] = headers
+            headers: t.OptionalDictStrAny = kwargs.get("headers")
+            kwargs["headers"] = {**headers, **self._auth_headers} if headers else self._auth_headers
 
         if data and method == "get":
-            kwargs["params"] = "&".join(f"{data[0]}={data[1]}" for data in kwargs["data"])
+            if not isinstance(data, t.t.Mapping):
+                raise TypeError(f"data of GET requests must be a mapping, not {type(data).__name__}")
+
+            params: t.DictStrAny = {}
+            self._update_params(params, tuple(data), tuple(data.values()))
+            kwargs["params"] = {**params, **(kwargs.get("params") or {})}
             del kwargs["data"]
 
+        json_body = kwargs.pop("json", None)
+        if json_body is not None:
+            kwargs["data"] = json_dumps_bytes(json_body)
+
         return kwargs
 
     @staticmethod
     def _pick(response: t.DictStrAny, key: str, value: t.t.Any, result_key: str = "results") -> t.DictStrAny:
         for _ in response.get(result_key, []):
             if _[key] == value:
-                response[result_key] = _
-                return response
+                return {**response, result_key: _}
         raise ValueError(f"{key} {value} not found in {response}")
 
+    def _batch_orders(self, orders: t.BulkOrderList, batch_size: t.OptionalInt = None) -> list[t.BulkOrderList]:
+        """
+        Group orders by market and split them into batches.
+
+        Args:
+            orders (BulkOrderList): A list of order objects, possibly in different markets.
+            batch_size (Optional[int]): Maximum orders per batch. Defaults to `MAX_BULK_ORDERS`.
+
+        Returns:
+            list: Batches of orders of a single market, in the order markets first appear.
+        """
+
+        if batch_size is None:
+            batch_size = self.MAX_BULK_ORDERS
+
+        markets: dict[str, t.BulkOrderList] = {}
+        for order in orders:
+            markets.setdefault(order["symbol"], []).append(order)
+
+        batches = []
+        for market_orders in markets.values():
+            for start in range(0, len(market_orders), batch_size):
+                end = start + batch_size
+                batches.append(market_orders[start:end])
+        return batches
+
+    def _pop_page_size(self, page_size: int, kwargs: t.DictStrAny) -> int:
+        """
+        Resolve page size of a paginated iterator, taking `limit` from `kwargs` if given.
+
+        Args:
+            page_size (int): Page size.
+            kwargs (dict): Kwargs of the iterator, `limit` is popped from it.
+
+        Returns:
+            int: Page size.
+
+        Raises:
+            ValueError: If page size is not between 1 and `MAX_PAGE_SIZE`.
+        """
+
+        if "limit" in kwargs:
+            page_size = kwargs.pop("limit")
+
+        if not 1 <= page_size <= self.MAX_PAGE_SIZE:
+            msg = f"Page size must be between 1 and {self.MAX_PAGE_SIZE}! got {page_size}"
+            raise ValueError(msg)
+
+        return page_size
+
+    @staticmethod
+    def _next_trades_offset(page: t.TradeResponse, advanced: bool) -> tuple[int, set[int]]:
+        """
+        Offset of the next page of trades and IDs of its trades that are already yielded.
+
+        Args:
+            page (list): Full page of trades.
+            advanced (bool): Whether the page had any trade that was not yielded before.
+
+        Returns:
+            tuple: Offset and IDs of already yielded trades.
+
+        Notes:
+            `offset` filters by order ID, and trades of the smallest order ID may continue on the next page.
+            That order is requested again and its yielded trades are skipped.
+            If a page had nothing new (one order with more trades than a page), the rest of that order is skipped.
+        """
+
+        boundary = min(trade["order_id"] for trade in page)
+        if not advanced:
+            return boundary, set()
+        return boundary + 1, {trade["id"] for trade in page if trade["order_id"] == boundary}
+
+    @staticmethod
+    def _update_params(params: t.DictStrAny, names: t.t.Tuple[str, ...], values: t.t.Tuple[t.t.Any, ...]) -> None:
+        """
+        Add query params that are not None, joining list values with commas.
+
+        Args:
+            params (dict): Params to update.
+            names (tuple): Param names.
+            values (tuple): Param values, in the same order as `names`.
+        """
+
+        for name, value in zip(names, values):
+            if value is None:
+                continue
+            params[name] = ",".join(map(str, value)) if isinstance(value, list) else str(value)
+
+    def _create_symbol_uri(self, template: str, symbol: str) -> str:
+        uri = self._symbol_uri_cache.get((template, symbol))
+        if uri is not None:
+            return uri
+
+        uri = self._create_api_uri(template.format(symbol), self.PUBLIC_API_VERSION_1)
+        if len(self._symbol_uri_cache) < self.URI_CACHE_MAX_SIZE:
+            self._symbol_uri_cache[(template, symbol)] = uri
+        return uri
+
     def _create_api_uri(self, path: str, version: str = PUBLIC_API_VERSION_1) -> str:
-        return self.API_URL + "/" + str(version) + "/" + path
+        uri = self._uri_cache.get((path, version))
+        if uri is not None:
+            return uri
+
+        base_uri = self._base_uris.get(version)
+        if base_uri is None:
+            base_uri = f"{self.API_URL}/{version}/"
+        return base_uri + path
 
     @abstractmethod
     def _init_session(self) -> t.HttpSession:
@@ -273,14 +479,24 @@ class CoreClient(ABC):  # pylint: disable=too-many-instance-attributes
         raise NotImplementedError
 
     @abstractmethod
-    def _background_relogin_task(self) -> None:
-        """Background relogin task."""
+    def _background_relogin_task(self, attempt: int = 0) -> None:
+        """
+        Background relogin task.
+
+        Args:
+            attempt (int): Number of consecutive failures.
+        """
 
         raise NotImplementedError
 
     @abstractmethod
-    def _background_refresh_token_task(self) -> None:
-        """Background refresh token task."""
+    def _background_refresh_token_task(self, attempt: int = 0) -> None:
+        """
+        Background refresh token task.
+
+        Args:
+            attempt (int): Number of consecutive failures.
+        """
 
         raise NotImplementedError
 
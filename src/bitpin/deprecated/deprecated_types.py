@@ -10,8 +10,9 @@ This file contains all the types used in the project.
 import asyncio
 import typing as t
 
-import aiohttp
-import requests
+if t.TYPE_CHECKING:  # pragma: no cover
+    import aiohttp
+    import requests
 
 from . import deprecated_enums
 
@@ -46,8 +47,8 @@ OrderModes = t.Union[
 OptionalOrderModes = t.Optional[OrderModes]
 
 # HTTP Types:
-HttpSession = t.Union[requests.Session, aiohttp.ClientSession]
-HttpResponses = t.Union[requests.Response, aiohttp.ClientResponse]
+HttpSession = t.Union["requests.Session", "aiohttp.ClientSession"]
+HttpResponses = t.Union["requests.Response", "aiohttp.ClientResponse"]
 
 # Request Types:
 RequestMethodGet = t.Literal["get"]
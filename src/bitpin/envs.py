@@ -0,0 +1,70 @@
+"""# Environment variables read by bitpin clients."""
+
+import functools
+import os
+import typing as t
+
+
+@functools.lru_cache(maxsize=None)
+def _get(name: str) -> t.Optional[str]:
+    """
+    Read an environment variable once.
+
+    Args:
+        name (str): Variable name.
+
+    Returns:
+        Optional[str]: Value, or None if not set.
+    """
+
+    return os.environ.get(name)
+
+
+def api_key() -> t.Optional[str]:
+    """
+    API key from `BITPIN_API_KEY`.
+
+    Returns:
+        Optional[str]: API key.
+    """
+
+    return _get("BITPIN_API_KEY")
+
+
+def api_secret() -> t.Optional[str]:
+    """
+    API secret from `BITPIN_API_SECRET`.
+
+    Returns:
+        Optional[str]: API secret.
+    """
+
+    return _get("BITPIN_API_SECRET")
+
+
+def access_token() -> t.Optional[str]:
+    """
+    Access token from `BITPIN_ACCESS_TOKEN`.
+
+    Returns:
+        Optional[str]: Access token.
+    """
+
+    return _get("BITPIN_ACCESS_TOKEN")
+
+
+def refresh_token() -> t.Optional[str]:
+    """
+    Refresh token from `BITPIN_REFRESH_TOKEN`.
+
+    Returns:
+        Optional[str]: Refresh token.
+    """
+
+    return _get("BITPIN_REFRESH_TOKEN")
+
+
+def refresh() -> None:
+    """Drop cached values so the next read sees the current environment."""
+
+    _get.cache_clear()
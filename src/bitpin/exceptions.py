@@ -8,6 +8,7 @@ This module contains all the exceptions that are raised by the bitpin package.
 """
 
 import json
+from functools import cached_property
 
 from . import response_types as t
 
@@ -23,31 +24,62 @@ class APIException(Exception):
         response (t.Union[requests.Response, aiohttp.ClientResponse]): Response.
         request (t.Union[requests.PreparedRequest, aiohttp.ClientRequest]): Request.
         url (str): URL.
+        text (t.Union[str, bytes]): Raw response body.
     """
 
-    def __init__(self, response: t.HttpResponses, status_code: int, text: str):
+    def __init__(self, response: t.HttpResponses, status_code: int, text: t.t.Union[str, bytes]):
         """
         Constructor.
 
         Args:
             response (t.Union[requests.Response, aiohttp.ClientResponse]): Response.
             status_code (int): Status code.
-            text (str): Text.
-        """
+            text (t.Union[str, bytes]): Raw response body.
 
-        try:
-            json_res = json.loads(text)
-        except ValueError:
-            self.message = f"Invalid JSON error message from Bitpin: {response.text}"
-            self.result = None
-        else:
-            self.message = json_res.get("detail", "Unknown error")
-            self.result = json_res.get("result")
+        Notes:
+            Response body is parsed lazily, the first time `message` or `result` is accessed.
+        """
 
         self.status_code = status_code
         self.response = response
         self.request = getattr(response, "request", None)
         self.url = getattr(response, "url", None)
+        self.text = text
+
+    @cached_property
+    def _error(self) -> tuple[str, t.t.Any]:
+        try:
+            json_res = json.loads(self.text)
+        except ValueError:
+            text = self.text.decode(errors="replace") if isinstance(self.text, bytes) else self.text
+            return f"Invalid JSON error message from Bitpin: {text}", None
+
+        if not isinstance(json_res, dict):
+            return "Unknown error", json_res
+
+        return json_res.get("detail", "Unknown error"), json_res.get("result")
+
+    @property
+    def message(self) -> str:
+        """
+        Message.
+
+        Returns:
+            str: Message.
+        """
+
+        return self._error[0]
+
+    @property
+    def result(self) -> t.t.Any:
+        """
+        Result.
+
+        Returns:
+            t.Any: Result.
+        """
+
+        return self._error[1]
 
     def __str__(self) -> str:
         """
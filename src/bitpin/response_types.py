@@ -11,11 +11,12 @@ import asyncio
 import typing as t
 from datetime import datetime
 
-import aiohttp
-import requests
-
 from . import enums
 
+if t.TYPE_CHECKING:  # pragma: no cover
+    import aiohttp
+    import requests
+
 # General Types:
 OptionalStr = t.Optional[str]
 OptionalInt = t.Optional[int]
@@ -58,8 +59,8 @@ OptionalOrderModes = t.Optional[OrderModes]
 OptionalOrderModesList = t.Optional[list[OrderModes]]
 
 # HTTP Types:
-HttpSession = t.Union[requests.Session, aiohttp.ClientSession]
-HttpResponses = t.Union[requests.Response, aiohttp.ClientResponse]
+HttpSession = t.Union["requests.Session", "aiohttp.ClientSession"]
+HttpResponses = t.Union["requests.Response", "aiohttp.ClientResponse"]
 
 # Request Types:
 RequestMethodGet = t.Literal["get"]
@@ -185,48 +186,43 @@ class CreateOrderResponse(t.TypedDict):
     commission: str
 
 
-OpenOrdersResponse = list[
-    t.TypedDict(
-        "OpenOrdersResponse",
-        {
-            "id": int,
-            "symbol": str,
-            "type": OrderModes,
-            "side": OrderTypes,
-            "base_amount": str,
-            "quote_amount": str,
-            "price": str,
-            "stop_price": OptionalStr,
-            "oco_target_price": OptionalStr,
-            "identifier": OptionalStr,
-            "state": str,
-            "created_at": str,
-            "closed_at": OptionalStr,
-            "dealed_base_amount": str,
-            "dealed_quote_amount": str,
-            "req_to_cancel": bool,
-            "commission": str,
-        },
-    )
-]
+class OpenOrder(t.TypedDict):
+    id: int
+    symbol: str
+    type: OrderModes
+    side: OrderTypes
+    base_amount: str
+    quote_amount: str
+    price: str
+    stop_price: OptionalStr
+    oco_target_price: OptionalStr
+    identifier: OptionalStr
+    state: str
+    created_at: str
+    closed_at: OptionalStr
+    dealed_base_amount: str
+    dealed_quote_amount: str
+    req_to_cancel: bool
+    commission: str
 
-TradeResponse = list[
-    t.TypedDict(
-        "TradeResponse",
-        {
-            "id": int,
-            "symbol": str,
-            "base_amount": str,
-            "quote_amount": str,
-            "price": str,
-            "created_at": str,
-            "commission": str,
-            "side": OrderTypes,
-            "order_id": int,
-            "identifier": OptionalStr,
-        },
-    )
-]
+
+OpenOrdersResponse = list[OpenOrder]
+
+
+class Trade(t.TypedDict):
+    id: int
+    symbol: str
+    base_amount: str
+    quote_amount: str
+    price: str
+    created_at: str
+    commission: str
+    side: OrderTypes
+    order_id: int
+    identifier: OptionalStr
+
+
+TradeResponse = list[Trade]
 
 
 class CancelOrderResponse(t.TypedDict):
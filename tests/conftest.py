@@ -0,0 +1,166 @@
+"""Fixtures serving a fake Bitpin API over a local HTTP server."""
+
+import json
+import threading
+import time
+import typing as t
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+from urllib.parse import (
+    parse_qsl,
+    urlsplit,
+)
+
+import pytest
+
+from bitpin import envs
+from bitpin.clients.async_client import AsyncClient
+from bitpin.clients.client import Client
+
+Reply = t.Tuple[int, t.Any]
+Route = t.Union[Reply, t.List[Reply], t.Callable[[t.Dict[str, str]], Reply]]
+
+
+class Request(t.NamedTuple):
+    method: str
+    path: str
+    query: t.Dict[str, str]
+    body: t.Any
+
+
+class FakeAPI:
+    """
+    Fake API answering requests from registered routes.
+
+    Notes:
+        A route is a reply, a list of replies used one per request (the last one repeats),
+        or a callable building the reply from the query params.
+    """
+
+    def __init__(self) -> None:
+        self.routes: t.Dict[t.Tuple[str, str], Route] = {}
+        self.requests: t.List[Request] = []
+        self.delay: float = 0
+        self._lock = threading.Lock()
+
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: t.Any) -> None:
+                pass
+
+            def _handle(self) -> None:
+                status, body = api.reply(self)
+                payload = b"" if body is None else json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _handle
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/api"
+
+    def route(self, method: str, path: str, reply: Route) -> None:
+        """Register reply of `method` requests to `path` (relative to `/api/v1/`)."""
+
+        self.routes[(method, f"/api/v1/{path}")] = reply
+
+    def calls(self, method: str, path: str) -> t.List[Request]:
+        """Received `method` requests to `path` (relative to `/api/v1/`)."""
+
+        return [request for request in self.requests if (request.method, request.path) == (method, f"/api/v1/{path}")]
+
+    def reply(self, handler: BaseHTTPRequestHandler) -> Reply:
+        url = urlsplit(handler.path)
+        length = int(handler.headers.get("Content-Length") or 0)
+        raw = handler.rfile.read(length) if length else b""
+        request = Request(handler.command, url.path, dict(parse_qsl(url.query)), json.loads(raw) if raw else None)
+
+        with self._lock:
+            self.requests.append(request)
+            route = self.routes.get((request.method, request.path), (404, {"detail": "Not found."}))
+            if isinstance(route, list):
+                route = route.pop(0) if len(route) > 1 else route[0]
+
+        if self.delay:
+            time.sleep(self.delay)
+
+        if callable(route):
+            return route(request.query)
+        return route
+
+
+def wait_for(predicate: t.Callable[[], bool], timeout: float = 2) -> None:
+    """Wait until `predicate` is true, failing after `timeout` seconds."""
+
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch: pytest.MonkeyPatch) -> t.Iterator[None]:
+    for name in ("BITPIN_API_KEY", "BITPIN_API_SECRET", "BITPIN_ACCESS_TOKEN", "BITPIN_REFRESH_TOKEN"):
+        monkeypatch.delenv(name, raising=False)
+    envs.refresh()
+    yield
+    envs.refresh()
+
+
+@pytest.fixture
+def api() -> t.Iterator[FakeAPI]:
+    fake = FakeAPI()
+    thread = threading.Thread(target=fake.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield fake
+    fake.server.shutdown()
+    fake.server.server_close()
+
+
+@pytest.fixture
+def client_class(api: FakeAPI) -> t.Type[Client]:
+    return type("FakeAPIClient", (Client,), {"__slots__": (), "API_URL": api.url, "RETRY_BACKOFF_FACTOR": 0})
+
+
+@pytest.fixture
+def async_client_class(api: FakeAPI) -> t.Type[AsyncClient]:
+    return type("FakeAPIAsyncClient", (AsyncClient,), {"__slots__": (), "API_URL": api.url})
+
+
+@pytest.fixture
+def paged_trades(api: FakeAPI) -> t.List[t.Tuple[int, int]]:
+    """User trades as (id, order_id), served newest first with `offset` filtering by order ID."""
+
+    trades = [(10, 5), (9, 5), (8, 4), (7, 4), (6, 4), (5, 3)]
+
+    def page(query: t.Dict[str, str]) -> Reply:
+        offset = int(query.get("offset", 1000))
+        matches = [{"id": i, "order_id": o} for i, o in trades if o < offset]
+        return 200, matches[: int(query["limit"])]
+
+    api.route("GET", "odr/fills/", page)
+    return trades
+
+
+@pytest.fixture
+def paged_orders(api: FakeAPI) -> t.List[int]:
+    """User order IDs, served newest first with `offset` filtering by order ID."""
+
+    orders = list(range(25, 0, -1))
+
+    def page(query: t.Dict[str, str]) -> Reply:
+        offset = int(query.get("offset", 1000))
+        return 200, [{"id": i} for i in orders if i < offset][: int(query["limit"])]
+
+    api.route("GET", "odr/orders/", page)
+    return orders
@@ -0,0 +1,191 @@
+import asyncio
+import typing as t
+
+import pytest
+
+from bitpin.clients import async_client
+from bitpin.clients.async_client import AsyncClient
+from bitpin.exceptions import APIException
+
+from .conftest import FakeAPI
+
+
+def test_cancel_order(api: FakeAPI, async_client_class: t.Type[AsyncClient]) -> None:
+    payload = {"canceled_orders": [1], "not_canceled_orders": [2]}
+    api.route("DELETE", "odr/orders/7/", (204, None))
+    api.route("DELETE", "odr/orders/8/", (404, {"detail": "Not found."}))
+    api.route("DELETE", "odr/orders/bulk/", (200, payload))
+
+    async def run() -> None:
+        async with async_client_class(access_token="access") as client:
+            assert await client.cancel_order("7") == {"status": "success", "id": "7"}
+            with pytest.raises(APIException):
+                await client.cancel_order("8")
+            assert await client.cancel_order_bulk(ids=[1, 2]) == payload
+
+    asyncio.run(run())
+
+
+def test_create_orders_parallel_returns_failed_batches(api: FakeAPI, async_client_class: t.Type[AsyncClient]) -> None:
+    api.route("POST", "odr/orders/", (400, {"detail": "Insufficient balance."}))
+    api.route("POST", "odr/orders/bulk/", (200, {"bulk": True}))
+    orders = [{"symbol": "ETH_USDT", "type": "limit", "side": "buy", "price": 1, "base_amount": 1}]
+    orders += [{"symbol": "BTC_IRT", "type": "limit", "side": "buy", "price": i, "base_amount": 1} for i in range(12)]
+
+    async def run() -> t.List[t.Any]:
+        async with async_client_class(access_token="access") as client:
+            return await client.create_orders_parallel(orders)  # type: ignore[arg-type]
+
+    failed, *placed = asyncio.run(run())
+
+    assert isinstance(failed, APIException) and failed.message == "Insufficient balance."
+    assert placed == [{"bulk": True}, {"bulk": True}]
+    assert len(api.calls("POST", "odr/orders/bulk/")) == 2
+
+
+@pytest.fixture
+def uvloop_installs(monkeypatch: pytest.MonkeyPatch) -> t.List[bool]:
+    installs: t.List[bool] = []
+
+    def install_uvloop() -> bool:
+        installs.append(True)
+        return True
+
+    monkeypatch.setattr(async_client, "install_uvloop", install_uvloop)
+    return installs
+
+
+def test_use_uvloop_installs_policy_before_loop(
+    async_client_class: t.Type[AsyncClient], uvloop_installs: t.List[bool]
+) -> None:
+    client = async_client_class(use_uvloop=True)
+    client.loop.close()
+    asyncio.set_event_loop(None)
+
+    assert uvloop_installs == [True]
+
+
+def test_use_uvloop_warns_inside_running_loop(
+    async_client_class: t.Type[AsyncClient], uvloop_installs: t.List[bool]
+) -> None:
+    async def run() -> None:
+        with pytest.warns(RuntimeWarning, match="use_uvloop"):
+            async with async_client_class(use_uvloop=True):
+                pass
+
+    asyncio.run(run())
+
+    assert not uvloop_installs
+
+
+def test_iter_user_trades_pages_by_order_id(
+    async_client_class: t.Type[AsyncClient], paged_trades: t.List[t.Tuple[int, int]]
+) -> None:
+    async def run() -> t.List[int]:
+        async with async_client_class(access_token="access") as client:
+            return [trade["id"] async for trade in client.iter_user_trades(limit=3)]
+
+    assert asyncio.run(run()) == [trade_id for trade_id, _ in paged_trades]
+
+
+def test_iter_user_orders_pages_by_order_id(
+    api: FakeAPI, async_client_class: t.Type[AsyncClient], paged_orders: t.List[int]
+) -> None:
+    async def run() -> t.List[int]:
+        async with async_client_class(access_token="access") as client:
+            return [order["id"] async for order in client.iter_user_orders(page_size=10)]
+
+    assert asyncio.run(run()) == paged_orders
+    assert [request.query.get("offset") for request in api.calls("GET", "odr/orders/")] == [None, "16", "6"]
+
+
+def test_iter_user_orders_rejects_page_size(async_client_class: t.Type[AsyncClient]) -> None:
+    async def run() -> None:
+        async with async_client_class(access_token="access") as client:
+            with pytest.raises(ValueError):
+                await client.iter_user_orders(page_size=101).__anext__()
+
+    asyncio.run(run())
+
+
+def test_login_and_refresh_share_in_flight_requests(api: FakeAPI, async_client_class: t.Type[AsyncClient]) -> None:
+    api.route("POST", "usr/authenticate/", (200, {"refresh": "refresh", "access": "access"}))
+    api.route("POST", "usr/refresh_token/", (200, {"access": "access"}))
+    api.delay = 0.1
+
+    async def run() -> None:
+        async with async_client_class(api_key="key", api_secret="secret") as client:
+            await asyncio.gather(*(client.login() for _ in range(3)))
+            await asyncio.gather(*(client.refresh_access_token("refresh") for _ in range(3)))
+
+    asyncio.run(run())
+
+    assert len(api.calls("POST", "usr/authenticate/")) == 1
+    assert len(api.calls("POST", "usr/refresh_token/")) == 1
+
+
+def test_close_connection_cancels_in_flight_login(api: FakeAPI, async_client_class: t.Type[AsyncClient]) -> None:
+    api.route("POST", "usr/authenticate/", (200, {"refresh": "refresh", "access": "access"}))
+    api.delay = 0.5
+
+    async def run() -> t.Optional[asyncio.Task]:
+        client = async_client_class(api_key="key", api_secret="secret")
+        pending = asyncio.ensure_future(client.login())
+        await asyncio.sleep(0.05)
+        task = client._login_task
+        await client.close_connection()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+        assert client._login_task is None and client.access_token is None
+        return task
+
+    task = asyncio.run(run())
+
+    assert task is not None and task.cancelled()
+
+
+def test_close_connection_cancels_background_refresh(api: FakeAPI, async_client_class: t.Type[AsyncClient]) -> None:
+    api.route("POST", "usr/refresh_token/", (200, {"access": "fresh"}))
+
+    async def run() -> asyncio.TimerHandle:
+        client = await async_client_class.create(
+            access_token="stale", refresh_token="refresh", background_refresh_token=True
+        )
+        await asyncio.sleep(0.2)
+        handle = client._refresh_handle
+        assert client.access_token == "fresh" and handle is not None
+        await client.close_connection()
+        assert client._refresh_handle is None and not client._background_tasks
+        return handle
+
+    assert asyncio.run(run()).cancelled()
+    assert len(api.calls("POST", "usr/refresh_token/")) == 1
+
+
+def test_get_orderbooks_keeps_symbol_order(api: FakeAPI, async_client_class: t.Type[AsyncClient]) -> None:
+    symbols = ["BTC_IRT", "ETH_USDT", "USDT_IRT"]
+    books = {symbol: {"asks": [[str(i), "1"]], "bids": []} for i, symbol in enumerate(symbols)}
+    for symbol, book in books.items():
+        api.route("GET", f"mth/orderbook/{symbol}/", (200, book))
+
+    async def run() -> t.Dict[str, t.Any]:
+        async with async_client_class() as client:
+            return await client.get_orderbooks(symbols)
+
+    orderbooks = asyncio.run(run())
+
+    assert list(orderbooks) == symbols
+    assert orderbooks == books
+
+
+def test_warm_up_sends_head_request(api: FakeAPI, async_client_class: t.Type[AsyncClient]) -> None:
+    api.route("GET", "mkt/tickers/", (200, []))
+
+    async def run() -> None:
+        async with async_client_class() as client:
+            await client.warm_up()
+            assert await client.get_tickers_info() == []
+
+    asyncio.run(run())
+
+    assert [request.method for request in api.requests] == ["HEAD", "GET"]
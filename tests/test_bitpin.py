@@ -0,0 +1,33 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import bitpin
+from bitpin.clients.client import Client
+
+SRC = str(Path(bitpin.__file__).parents[1])
+
+
+def run_python(code: str) -> None:
+    subprocess.run([sys.executable, "-c", code], check=True, env={"PYTHONPATH": SRC})
+
+
+def test_import_does_not_load_clients() -> None:
+    run_python("import sys, bitpin; assert 'bitpin.clients.client' not in sys.modules and 'aiohttp' not in sys.modules")
+
+
+def test_star_import() -> None:
+    run_python("from bitpin import *; assert Client and AsyncClient")
+
+
+def test_clients_are_imported_on_access() -> None:
+    assert bitpin.Client is Client
+    assert {"AsyncClient", "Client"} <= set(dir(bitpin))
+
+
+def test_unknown_attribute() -> None:
+    assert not hasattr(bitpin, "deprecated")
+    with pytest.raises(AttributeError):
+        getattr(bitpin, "missing")
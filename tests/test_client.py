@@ -0,0 +1,190 @@
+import threading
+import typing as t
+
+import pytest
+
+from bitpin.clients.client import Client
+from bitpin.exceptions import APIException
+
+from .conftest import (
+    FakeAPI,
+    wait_for,
+)
+
+
+def order(symbol: str, price: float = 1) -> t.Dict[str, t.Any]:
+    return {"symbol": symbol, "type": "limit", "side": "buy", "price": price, "base_amount": 1}
+
+
+def test_create_orders_parallel_batches(api: FakeAPI, client_class: t.Type[Client]) -> None:
+    api.route("POST", "odr/orders/", (200, {"single": True}))
+    api.route("POST", "odr/orders/bulk/", (200, {"bulk": True}))
+    orders = [order("BTC_IRT", i) for i in range(12)] + [order("ETH_USDT")]
+
+    with client_class(access_token="access", max_workers=2) as client:
+        results = client.create_orders_parallel(orders)  # type: ignore[arg-type]
+
+    assert results == [{"bulk": True}, {"bulk": True}, {"single": True}]
+    bulk_sizes = sorted(len(request.body["orders"]) for request in api.calls("POST", "odr/orders/bulk/"))
+    assert bulk_sizes == [2, 10]
+    assert api.calls("POST", "odr/orders/")[0].body["symbol"] == "ETH_USDT"
+
+
+def test_cancel_order_without_body_returns_success(api: FakeAPI, client_class: t.Type[Client]) -> None:
+    api.route("DELETE", "odr/orders/7/", (204, None))
+
+    with client_class(access_token="access") as client:
+        assert client.cancel_order("7") == {"status": "success", "id": "7"}
+
+
+def test_cancel_order_raises_on_error(api: FakeAPI, client_class: t.Type[Client]) -> None:
+    api.route("DELETE", "odr/orders/7/", (404, {"detail": "Not found."}))
+
+    with client_class(access_token="access") as client, pytest.raises(APIException):
+        client.cancel_order("7")
+
+
+def test_cancel_order_bulk_returns_payload(api: FakeAPI, client_class: t.Type[Client]) -> None:
+    payload = {"canceled_orders": [1], "not_canceled_orders": [2]}
+    api.route("DELETE", "odr/orders/bulk/", (200, payload))
+
+    with client_class(access_token="access") as client:
+        assert client.cancel_order_bulk(ids=[1, 2]) == payload
+
+    assert api.calls("DELETE", "odr/orders/bulk/")[0].body == {"ids": [1, 2]}
+
+
+def test_create_orders_parallel_returns_failed_batches(api: FakeAPI, client_class: t.Type[Client]) -> None:
+    api.route("POST", "odr/orders/", (400, {"detail": "Insufficient balance."}))
+    api.route("POST", "odr/orders/bulk/", (200, {"bulk": True}))
+    orders = [order("ETH_USDT")] + [order("BTC_IRT", i) for i in range(12)]
+
+    with client_class(access_token="access") as client:
+        failed, *placed = client.create_orders_parallel(orders)  # type: ignore[arg-type]
+
+    assert isinstance(failed, APIException) and failed.message == "Insufficient balance."
+    assert placed == [{"bulk": True}, {"bulk": True}]
+    assert len(api.calls("POST", "odr/orders/bulk/")) == 2
+
+
+def test_scheduler_retries_failed_refresh(api: FakeAPI, client_class: t.Type[Client]) -> None:
+    api.route("POST", "usr/refresh_token/", [(500, {}), (200, {"access": "fresh"})])
+    fast_retry = type("FastRetryClient", (client_class,), {"__slots__": (), "BACKGROUND_RETRY_MAX_DELAY": 0.01})
+    client = fast_retry(
+        access_token="stale",
+        refresh_token="refresh",
+        background_refresh_token=True,
+        background_refresh_token_interval=3600,
+    )
+
+    wait_for(lambda: client.access_token == "fresh")
+    client.close_connection()
+
+    assert len(api.calls("POST", "usr/refresh_token/")) == 2
+
+
+def test_iter_user_trades_pages_by_order_id(
+    client_class: t.Type[Client], paged_trades: t.List[t.Tuple[int, int]]
+) -> None:
+    with client_class(access_token="access") as client:
+        ids = [trade["id"] for trade in client.iter_user_trades(page_size=3)]
+
+    assert ids == [trade_id for trade_id, _ in paged_trades]
+
+
+@pytest.mark.parametrize("kwargs", [{"page_size": 0}, {"page_size": 101}, {"limit": 101}])
+def test_iter_user_trades_rejects_page_size(client_class: t.Type[Client], kwargs: t.Dict[str, int]) -> None:
+    with client_class(access_token="access") as client, pytest.raises(ValueError):
+        next(client.iter_user_trades(**kwargs))
+
+
+def test_iter_user_orders_pages_by_order_id(
+    api: FakeAPI, client_class: t.Type[Client], paged_orders: t.List[int]
+) -> None:
+    with client_class(access_token="access") as client:
+        ids = [order["id"] for order in client.iter_user_orders(limit=10)]
+
+    assert ids == paged_orders
+    assert [request.query.get("offset") for request in api.calls("GET", "odr/orders/")] == [None, "16", "6"]
+
+
+@pytest.mark.parametrize("kwargs", [{"page_size": 0}, {"limit": 101}])
+def test_iter_user_orders_rejects_page_size(client_class: t.Type[Client], kwargs: t.Dict[str, int]) -> None:
+    with client_class(access_token="access") as client, pytest.raises(ValueError):
+        next(client.iter_user_orders(**kwargs))
+
+
+def test_idempotent_requests_are_retried(api: FakeAPI, client_class: t.Type[Client]) -> None:
+    api.route("GET", "mkt/tickers/", [(503, None), (200, [])])
+    api.route("POST", "odr/orders/", (503, None))
+
+    with client_class(access_token="access") as client:
+        assert client.get_tickers_info() == []
+        with pytest.raises(APIException):
+            client.create_order("BTC_IRT", "limit", "buy", 1, price=1)
+
+    assert len(api.calls("GET", "mkt/tickers/")) == 2
+    assert len(api.calls("POST", "odr/orders/")) == 1
+
+
+def test_concurrent_login_and_refresh_send_one_request(api: FakeAPI, client_class: t.Type[Client]) -> None:
+    api.route(
+        "POST", "usr/authenticate/", [(200, {"refresh": f"refresh{i}", "access": f"access{i}"}) for i in range(3)]
+    )
+    api.route("POST", "usr/refresh_token/", [(200, {"access": f"refreshed{i}"}) for i in range(2)])
+    api.delay = 0.1
+
+    with client_class(api_key="key", api_secret="secret") as client:
+        for method in (client.login, client.refresh_access_token):
+            barrier = threading.Barrier(4)
+            threads = [threading.Thread(target=lambda: (barrier.wait(), method())) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert (client.refresh_token, client.access_token) == ("refresh1", "refreshed0")
+
+    assert len(api.calls("POST", "usr/authenticate/")) == 2
+    assert len(api.calls("POST", "usr/refresh_token/")) == 1
+
+
+def test_create_order_bulk_rejects_too_many_orders(api: FakeAPI, client_class: t.Type[Client]) -> None:
+    with client_class(access_token="access") as client, pytest.raises(ValueError):
+        client.create_order_bulk([order("BTC_IRT", i) for i in range(client.MAX_BULK_ORDERS + 1)])
+
+    assert not api.calls("POST", "odr/orders/bulk/")
+
+
+def test_close_connection_joins_scheduler_thread(client_class: t.Type[Client]) -> None:
+    client = client_class(access_token="access", refresh_token="refresh", background_refresh_token=True)
+    thread = client._scheduler_thread
+    assert thread is not None and thread.is_alive()
+
+    client.close_connection()
+
+    assert not thread.is_alive()
+    assert client._scheduler_thread is None
+
+
+def test_get_orderbooks_keeps_symbol_order(api: FakeAPI, client_class: t.Type[Client]) -> None:
+    symbols = ["BTC_IRT", "ETH_USDT", "USDT_IRT"]
+    books = {symbol: {"asks": [[str(i), "1"]], "bids": []} for i, symbol in enumerate(symbols)}
+    for symbol, book in books.items():
+        api.route("GET", f"mth/orderbook/{symbol}/", (200, book))
+
+    with client_class(max_workers=3) as client:
+        orderbooks = client.get_orderbooks(symbols)
+
+    assert list(orderbooks) == symbols
+    assert orderbooks == books
+
+
+def test_warm_up_sends_head_request(api: FakeAPI, client_class: t.Type[Client]) -> None:
+    api.route("GET", "mkt/tickers/", (200, []))
+
+    with client_class() as client:
+        client.warm_up()
+        assert client.get_tickers_info() == []
+
+    assert [request.method for request in api.requests] == ["HEAD", "GET"]
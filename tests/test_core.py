@@ -0,0 +1,55 @@
+import json
+import typing as t
+
+import pytest
+
+from bitpin.clients.client import Client
+
+
+def test_batch_orders_groups_by_market_in_order(client_class: t.Type[Client]) -> None:
+    orders = [{"symbol": "BTC_IRT", "n": i} for i in range(23)]
+    orders.insert(5, {"symbol": "ETH_USDT", "n": 100})
+
+    with client_class() as client:
+        batches = client._batch_orders(orders)  # type: ignore[arg-type]
+
+    assert [len(batch) for batch in batches] == [10, 10, 3, 1]
+    assert [order["n"] for batch in batches[:3] for order in batch] == list(range(23))
+    assert batches[3] == [{"symbol": "ETH_USDT", "n": 100}]
+
+
+def test_batch_orders_uses_max_bulk_orders_override(client_class: t.Type[Client]) -> None:
+    small_batches = type("SmallBatchClient", (client_class,), {"__slots__": (), "MAX_BULK_ORDERS": 4})
+    orders = [{"symbol": "BTC_IRT", "n": i} for i in range(10)]
+
+    with small_batches() as client:
+        assert [len(batch) for batch in client._batch_orders(orders)] == [4, 4, 2]  # type: ignore[arg-type]
+        assert [len(batch) for batch in client._batch_orders(orders, 5)] == [5, 5]  # type: ignore[arg-type]
+
+
+def test_get_request_kwargs_merges_data_into_params(client_class: t.Type[Client]) -> None:
+    with client_class() as client:
+        kwargs = client._get_request_kwargs(
+            "get",
+            False,
+            data={"symbol": "BTC_IRT", "state": ["active", "closed"], "offset": None, "limit": 5},
+            params={"limit": 10},
+        )
+
+    assert "data" not in kwargs
+    assert kwargs["params"] == {"symbol": "BTC_IRT", "state": "active,closed", "limit": 10}
+
+
+def test_get_request_kwargs_rejects_non_mapping_data(client_class: t.Type[Client]) -> None:
+    with client_class() as client, pytest.raises(TypeError):
+        client._get_request_kwargs("get", False, data=[("symbol", "BTC_IRT")])
+
+
+def test_get_request_kwargs_serializes_json_body(client_class: t.Type[Client]) -> None:
+    body = {"symbol": "BTC_IRT", "price": 1.5, "side": "buy"}
+
+    with client_class() as client:
+        kwargs = client._get_request_kwargs("post", False, json=body)
+
+    assert "json" not in kwargs
+    assert isinstance(kwargs["data"], bytes) and json.loads(kwargs["data"]) == body
@@ -0,0 +1,27 @@
+import typing as t
+
+import pytest
+
+from bitpin import envs
+from bitpin.clients.client import Client
+
+
+def test_values_are_cached_until_refresh(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BITPIN_ACCESS_TOKEN", "first")
+    envs.refresh()
+    assert envs.access_token() == "first"
+
+    monkeypatch.setenv("BITPIN_ACCESS_TOKEN", "second")
+    assert envs.access_token() == "first"
+
+    envs.refresh()
+    assert envs.access_token() == "second"
+
+
+def test_client_reads_credentials_from_env(monkeypatch: pytest.MonkeyPatch, client_class: t.Type[Client]) -> None:
+    monkeypatch.setenv("BITPIN_ACCESS_TOKEN", "access")
+    monkeypatch.setenv("BITPIN_REFRESH_TOKEN", "refresh")
+    envs.refresh()
+
+    with client_class() as client:
+        assert (client.access_token, client.refresh_token) == ("access", "refresh")
@@ -0,0 +1,18 @@
+from bitpin.exceptions import APIException
+
+
+def test_api_exception_parses_body_on_access() -> None:
+    exc = APIException(None, 400, b'{"detail": "Invalid symbol.", "result": {"symbol": "XYZ"}}')  # type: ignore[arg-type]
+
+    assert "_error" not in exc.__dict__
+    assert exc.message == "Invalid symbol."
+    assert exc.result == {"symbol": "XYZ"}
+    assert "_error" in exc.__dict__
+
+
+def test_api_exception_with_invalid_json() -> None:
+    exc = APIException(None, 502, b"<html>Bad Gateway</html>")  # type: ignore[arg-type]
+
+    assert exc.message == "Invalid JSON error message from Bitpin: <html>Bad Gateway</html>"
+    assert exc.result is None
+    assert str(exc) == f"APIError(code=502): {exc.message} | None | None"
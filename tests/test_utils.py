@@ -0,0 +1,53 @@
+import asyncio
+import types
+import typing as t
+
+import pytest
+
+from bitpin import _utils
+from bitpin._utils import ttl_cached
+
+
+class Counter:
+    __slots__ = ("_ttl_cache", "calls")
+
+    def __init__(self) -> None:
+        self._ttl_cache: t.Dict[str, t.Any] = {}
+        self.calls = 0
+
+    @ttl_cached(10)
+    def count(self, step: int = 1) -> int:
+        self.calls += step
+        return self.calls
+
+    @ttl_cached(10)
+    async def async_count(self, step: int = 1) -> int:
+        self.calls += step
+        return self.calls
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> types.SimpleNamespace:
+    now = types.SimpleNamespace(value=100.0)
+    monkeypatch.setattr(_utils, "time", types.SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def test_ttl_cached_expires(clock: types.SimpleNamespace) -> None:
+    counter = Counter()
+
+    assert [counter.count(), counter.count()] == [1, 1]
+    assert counter.count(step=2) == 3
+    clock.value += 10
+    assert counter.count() == 4
+
+
+def test_ttl_cached_coroutine_function_expires(clock: types.SimpleNamespace) -> None:
+    counter = Counter()
+
+    async def run() -> t.List[int]:
+        results = [await counter.async_count(), await counter.async_count()]
+        clock.value += 10
+        return results + [await counter.async_count()]
+
+    assert asyncio.run(run()) == [1, 1, 2]